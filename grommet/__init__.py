@@ -1,9 +1,11 @@
+from .dataloader import DataLoader
 from .decorators import field, input, interface, subscription, type
 from .metadata import Context, Field, Hidden, Union
 from .schema import Schema
 
 __all__ = [
     "Context",
+    "DataLoader",
     "Field",
     "Hidden",
     "Schema",
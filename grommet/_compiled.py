@@ -4,9 +4,9 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from builtins import type as pytype
     from collections.abc import Callable
-    from typing import Any, Literal
+    from typing import Any
 
-    from .metadata import TypeMeta, TypeSpec
+    from .metadata import ResolverKind, TypeMeta, TypeSpec
 
 META_ATTR = "__grommet_meta__"
 REFS_ATTR = "__grommet_refs__"
@@ -24,10 +24,11 @@ class CompiledArg:
 
 @dataclass(frozen=True, slots=True)
 class CompiledResolverField:
-    kind: "Literal['field', 'subscription']"
+    kind: "ResolverKind"
     name: str
     func: "Callable[..., Any]"
     needs_context: bool
+    self_only: bool
     is_async: bool
     type_spec: "TypeSpec"
     description: str | None
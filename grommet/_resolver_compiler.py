@@ -1,7 +1,11 @@
 import inspect
-from typing import TYPE_CHECKING
+import sys
+from functools import cache, wraps
+from types import FunctionType
+from typing import TYPE_CHECKING, cast
+from weakref import WeakKeyDictionary
 
-from noaio import can_syncify, syncify
+from noaio import can_syncify
 
 from ._annotations import get_annotations
 from ._compiled import CompiledArg, CompiledResolverField
@@ -11,28 +15,101 @@ from .annotations import (
     unwrap_async_iterable,
     walk_annotation,
 )
-from .coercion import _arg_coercer, _default_value_for_annotation
+from .coercion import _arg_coercer, _default_value_for_annotation, _direct_input_type
 from .errors import (
     resolver_context_annotation_requires_annotated,
     resolver_missing_annotation,
     resolver_requires_async,
 )
-from .metadata import Context
+from .metadata import MISSING, Context, ResolverKind
 
 if TYPE_CHECKING:
     from builtins import type as pytype
-    from collections.abc import Callable
+    from collections.abc import Callable, Coroutine
+    from types import CodeType
     from typing import Any, Literal
 
+    type ArgConversion = Literal["raw", "coerce", "input"]
+
+# Weakly keyed so resolvers created at runtime do not keep their code objects alive.
+_SYNCIFIABLE_CODE: "WeakKeyDictionary[CodeType, bool]" = WeakKeyDictionary()
+
+
+def _per_resolver[T](
+    compute: "Callable[[Callable[..., Any]], T]",
+) -> "Callable[[Callable[..., Any]], T]":
+    """
+    Memoize a per-resolver helper without keeping resolvers alive. Callables that
+    cannot be weakly referenced, or are unhashable, are computed on every call.
+    """
+    results: "WeakKeyDictionary[Any, T]" = WeakKeyDictionary()
+
+    @wraps(compute)
+    def cached(resolver: "Callable[..., Any]") -> T:
+        try:
+            return results[resolver]
+        except KeyError:
+            pass
+        except TypeError:
+            return compute(resolver)
+        result = results[resolver] = compute(resolver)
+        return result
+
+    return cached
+
+
+def _code_params(resolver: FunctionType) -> tuple[inspect.Parameter, ...]:
+    """Build named parameters straight from a plain function's code object."""
+    code = resolver.__code__
+    positional_count = code.co_argcount
+    names = code.co_varnames[: positional_count + code.co_kwonlyargcount]
+    defaults = resolver.__defaults__ or ()
+    kwdefaults = resolver.__kwdefaults__ or {}
+    annotations = resolver.__annotations__
+    first_default = positional_count - len(defaults)
+
+    params: list[inspect.Parameter] = []
+    for index, name in enumerate(names):
+        default: object = inspect.Parameter.empty
+        kind: inspect._ParameterKind
+        if index < code.co_posonlyargcount:
+            kind = inspect.Parameter.POSITIONAL_ONLY
+        elif index < positional_count:
+            kind = inspect.Parameter.POSITIONAL_OR_KEYWORD
+        else:
+            kind = inspect.Parameter.KEYWORD_ONLY
+            default = kwdefaults.get(name, default)
+        if first_default <= index < positional_count:
+            default = defaults[index - first_default]
+        params.append(
+            inspect.Parameter(
+                name,
+                kind,
+                default=default,
+                annotation=annotations.get(name, inspect.Parameter.empty),
+            )
+        )
+    return tuple(params)
 
-def _resolver_params(resolver: "Callable[..., Any]") -> list[inspect.Parameter]:
+
+@_per_resolver
+def _signature_params(resolver: "Callable[..., Any]") -> tuple[inspect.Parameter, ...]:
+    # Wrapped functions and explicit __signature__ overrides need inspect's unwrapping.
+    if type(resolver) is FunctionType and not (
+        "__wrapped__" in resolver.__dict__ or "__signature__" in resolver.__dict__
+    ):
+        return _code_params(resolver)
     sig = inspect.signature(resolver)
-    return [
+    return tuple(
         p
         for p in sig.parameters.values()
         if p.kind
         not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
-    ]
+    )
+
+
+def _resolver_params(resolver: "Callable[..., Any]") -> list[inspect.Parameter]:
+    return list(_signature_params(resolver))
 
 
 def _is_context_annotation(annotation: "Any") -> bool:
@@ -43,40 +120,165 @@ def _is_bare_context_annotation(annotation: "Any") -> bool:
     return annotation is Context
 
 
+@_per_resolver
+def _resolver_hints(resolver: "Callable[..., Any]") -> dict[str, "Any"]:
+    """Resolve a resolver's annotations once; the shared result must not be mutated."""
+    return get_annotations(resolver)
+
+
+def _can_syncify(resolver: "Callable[..., Any]") -> bool:
+    """Return whether an async resolver is await-free, walking each code object once."""
+    code = getattr(resolver, "__code__", None)
+    if code is None or not code.co_flags & inspect.CO_COROUTINE:
+        # noaio can only disassemble coroutine functions, so wrappers and sync functions
+        # marked with markcoroutinefunction stay async.
+        return False
+    syncifiable = _SYNCIFIABLE_CODE.get(code)
+    if syncifiable is None:
+        syncifiable = _SYNCIFIABLE_CODE[code] = can_syncify(resolver)
+    return syncifiable
+
+
+def _syncified(resolver: "Callable[..., Any]", self_only: bool) -> "Callable[..., Any]":
+    """
+    Drive an await-free async resolver to completion with a single ``send``.
+    Callers must have checked ``_can_syncify`` already, so unlike ``noaio.syncify``
+    this neither re-walks the bytecode nor closes the finished coroutine per call.
+    Self-only resolvers get a one-argument shim so Rust's ``func(parent)`` call packs
+    no ``*args``/``**kwargs``.
+    """
+    if self_only:
+
+        def _sync_self(parent: "Any") -> "Any":
+            coro = resolver(parent)
+            try:
+                coro.send(None)
+            except StopIteration as stop:
+                return stop.value
+            raise _unexpected_await(resolver, coro)
+
+        return wraps(resolver)(_sync_self)
+
+    def _sync(parent: "Any", /, **kwargs: "Any") -> "Any":
+        coro = resolver(parent, **kwargs)
+        try:
+            coro.send(None)
+        except StopIteration as stop:
+            return stop.value
+        raise _unexpected_await(resolver, coro)
+
+    return wraps(resolver)(_sync)
+
+
+def _unexpected_await(
+    resolver: "Callable[..., Any]", coro: "Coroutine[Any, Any, Any]"
+) -> RuntimeError:
+    coro.close()
+    return RuntimeError(f"Resolver '{_resolver_name(resolver)}' awaited unexpectedly.")
+
+
+def _is_async_gen(resolver: "Callable[..., Any]") -> bool:
+    """Read the async-generator flag off plain functions, deferring to inspect for wrappers."""
+    code = getattr(resolver, "__code__", None)
+    if code is None:
+        return inspect.isasyncgenfunction(resolver)
+    return bool(code.co_flags & inspect.CO_ASYNC_GENERATOR)
+
+
+def _is_coroutine(resolver: "Callable[..., Any]") -> bool:
+    """Read the coroutine flag off plain functions, deferring to inspect otherwise."""
+    code = getattr(resolver, "__code__", None)
+    # The flag is only a fast positive check; inspect also honours markcoroutinefunction.
+    if code is not None and code.co_flags & inspect.CO_COROUTINE:
+        return True
+    return inspect.iscoroutinefunction(resolver)
+
+
 def _resolver_name(resolver: "Callable[..., Any]") -> str:
     return getattr(resolver, "__name__", resolver.__class__.__name__)
 
 
+def _arg_conversion(
+    name: str,
+    coercer_map: dict[str, "Callable[[Any], Any]"],
+    input_types: dict[str, type],
+) -> "ArgConversion":
+    if name in input_types:
+        return "input"
+    if name in coercer_map:
+        return "coerce"
+    return "raw"
+
+
+@cache
+def _adapter_code(
+    context_param_names: tuple[str, ...],
+    arg_shapes: tuple[tuple[str, "ArgConversion", bool], ...],
+) -> "CodeType":
+    """Compile the adapter body shared by every resolver with the given call shape."""
+
+    def value_expr(index: int, name: str, conversion: "ArgConversion") -> str:
+        if conversion == "input":
+            return f"_input_{name}(**args[{index}])"
+        if conversion == "coerce":
+            return f"_coerce_{name}(args[{index}])"
+        return f"args[{index}]"
+
+    bound = [(name, "context") for name in context_param_names]
+    optional: list[tuple[int, str, "ArgConversion"]] = []
+    for index, (name, conversion, is_optional) in enumerate(arg_shapes):
+        if is_optional:
+            optional.append((index, name, conversion))
+        else:
+            bound.append((name, value_expr(index, name, conversion)))
+
+    lines = ["def _adapter(parent, context, args):"]
+    if optional:
+        entries = ", ".join(f"{name!r}: {value}" for name, value in bound)
+        lines.append(f"    call_kwargs = {{{entries}}}")
+        for index, name, conversion in optional:
+            value = value_expr(index, name, conversion)
+            lines.append(f"    if args[{index}] is not _MISSING:")
+            lines.append(f"        call_kwargs[{name!r}] = {value}")
+        lines.append("    return _func(parent, **call_kwargs)")
+    else:
+        call_args = ["parent", *(f"{name}={value}" for name, value in bound)]
+        lines.append(f"    return _func({', '.join(call_args)})")
+
+    namespace: dict[str, "Any"] = {}
+    exec(compile("\n".join(lines), "<grommet adapter>", "exec"), namespace)
+    return cast("CodeType", namespace["_adapter"].__code__)
+
+
 def _resolver_adapter(
     func: "Callable[..., Any]",
     *,
     context_param_names: tuple[str, ...],
-    arg_names: tuple[str, ...],
+    args: tuple[CompiledArg, ...],
     coercers: list[tuple[str, "Callable[[Any], Any]"]],
+    input_types: dict[str, type],
 ) -> "Callable[..., Any]":
-    """Adapt a resolver to a stable runtime call shape used by Rust."""
+    """Adapt a resolver to Rust's positional ``(parent, context, args)`` call."""
     coercer_map = dict(coercers)
+    arg_shapes = tuple(
+        (
+            arg.name,
+            _arg_conversion(arg.name, coercer_map, input_types),
+            arg.has_default or arg.type_spec.nullable,
+        )
+        for arg in args
+    )
 
-    def _adapter(parent: "Any", context: "Any", kwargs: dict[str, "Any"]) -> "Any":
-        call_kwargs: dict[str, "Any"] = {}
-
-        for name in context_param_names:
-            call_kwargs[name] = context
-
-        for name in arg_names:
-            if name not in kwargs:
-                continue
-            value = kwargs[name]
-            coercer = coercer_map.get(name)
-            if coercer is not None:
-                value = coercer(value)
-            call_kwargs[name] = value
-
-        return func(parent, **call_kwargs)
+    code = _adapter_code(context_param_names, arg_shapes)
+    namespace: dict[str, "Any"] = {"_func": func, "_MISSING": MISSING}
+    for name, coercer in coercer_map.items():
+        namespace[f"_coerce_{name}"] = coercer
+    for name, input_type in input_types.items():
+        namespace[f"_input_{name}"] = input_type
 
-    _adapter.__name__ = getattr(func, "__name__", "wrapped")
-    _adapter.__qualname__ = getattr(func, "__qualname__", "wrapped")
-    return _adapter
+    adapter = FunctionType(code, namespace, getattr(func, "__name__", "wrapped"))
+    adapter.__qualname__ = getattr(func, "__qualname__", "wrapped")
+    return adapter
 
 
 def _partition_context_params(
@@ -106,9 +308,11 @@ def _partition_context_params(
 
 def _build_arg_info(
     resolver_name: str, params: list[inspect.Parameter], hints: dict[str, "Any"]
-) -> tuple[list[str], list[tuple[str, "Callable[[Any], Any]"]], list[CompiledArg]]:
-    arg_names: list[str] = []
+) -> tuple[
+    list[tuple[str, "Callable[[Any], Any]"]], dict[str, type], list[CompiledArg]
+]:
     coercers: list[tuple[str, "Callable[[Any], Any]"]] = []
+    input_types: dict[str, type] = {}
     args: list[CompiledArg] = []
 
     for param in params:
@@ -116,18 +320,20 @@ def _build_arg_info(
         if annotation is inspect._empty:
             raise resolver_missing_annotation(resolver_name, param.name)
 
-        arg_names.append(param.name)
-
-        coercer = _arg_coercer(annotation)
-        if coercer is not None:
-            coercers.append((param.name, coercer))
+        has_default = param.default is not inspect._empty
+        # Defaulted args accept an explicit null, so only required ones skip the coercer.
+        input_type = None if has_default else _direct_input_type(annotation)
+        if input_type is not None:
+            input_types[param.name] = input_type
+        else:
+            coercer = _arg_coercer(annotation)
+            if coercer is not None:
+                coercers.append((param.name, coercer))
 
-        force_nullable = param.default is not inspect._empty
         type_spec = _type_spec_from_annotation(
-            annotation, expect_input=True, force_nullable=force_nullable
+            annotation, expect_input=True, force_nullable=has_default
         )
 
-        has_default = param.default is not inspect._empty
         default: object | None = None
         if has_default:
             default = _default_value_for_annotation(annotation, param.default)
@@ -141,7 +347,7 @@ def _build_arg_info(
             )
         )
 
-    return arg_names, coercers, args
+    return coercers, input_types, args
 
 
 def _collect_refs(
@@ -160,45 +366,49 @@ def compile_resolver_field(
     *,
     field_name: str,
     description: str | None,
-    kind: "Literal['field', 'subscription']",
+    kind: ResolverKind,
 ) -> CompiledResolverField:
     """Compile a resolver into an immutable blueprint used for schema registration."""
     resolver_name = _resolver_name(resolver)
 
-    if kind == "subscription" and not inspect.isasyncgenfunction(resolver):
+    if kind is ResolverKind.SUBSCRIPTION and not _is_async_gen(resolver):
         raise resolver_requires_async(resolver_name, field_name)
 
-    hints = get_annotations(resolver)
+    hints = _resolver_hints(resolver)
     params = _resolver_params(resolver)
     context_param_names, graphql_arg_params = _partition_context_params(
         resolver_name, params[1:], hints
     )
 
-    arg_names, coercers, args = _build_arg_info(
+    coercers, input_types, args = _build_arg_info(
         resolver_name, graphql_arg_params, hints
     )
-    is_coroutine = inspect.iscoroutinefunction(resolver)
-    is_async = kind == "subscription" or is_coroutine
+    is_coroutine = _is_coroutine(resolver)
+    is_async = kind is ResolverKind.SUBSCRIPTION or is_coroutine
     func = resolver
+    self_only = not context_param_names and not args
 
-    if kind == "field" and is_coroutine and can_syncify(resolver):
-        func = syncify(resolver)
+    if kind is ResolverKind.FIELD and is_coroutine and _can_syncify(resolver):
+        func = _syncified(resolver, self_only)
         is_async = False
 
-    arg_names_tuple = tuple(arg_names)
-    func = _resolver_adapter(
-        func,
-        context_param_names=tuple(context_param_names),
-        arg_names=arg_names_tuple,
-        coercers=coercers,
-    )
+    if not self_only:
+        func = _resolver_adapter(
+            func,
+            context_param_names=tuple(context_param_names),
+            args=tuple(args),
+            coercers=coercers,
+            input_types=input_types,
+        )
 
     return_ann = hints.get("return", inspect._empty)
     if return_ann is inspect._empty:
         raise resolver_missing_annotation(resolver_name, "return")
 
     output_ann = (
-        unwrap_async_iterable(return_ann)[0] if kind == "subscription" else return_ann
+        unwrap_async_iterable(return_ann)[0]
+        if kind is ResolverKind.SUBSCRIPTION
+        else return_ann
     )
     type_spec = _type_spec_from_annotation(output_ann, expect_input=False)
 
@@ -206,9 +416,10 @@ def compile_resolver_field(
 
     return CompiledResolverField(
         kind=kind,
-        name=field_name,
+        name=sys.intern(field_name),
         func=func,
         needs_context=bool(context_param_names),
+        self_only=self_only,
         is_async=is_async,
         type_spec=type_spec,
         description=description,
@@ -1,4 +1,5 @@
 import dataclasses
+import sys
 from operator import attrgetter
 from typing import TYPE_CHECKING
 
@@ -23,14 +24,24 @@ from .annotations import (
 )
 from .coercion import _input_field_default
 from .errors import GrommetTypeError, input_field_resolver_not_allowed
-from .metadata import MISSING, Field, TypeKind, TypeMeta
+from .metadata import MISSING, Field, ResolverKind, TypeKind, TypeMeta
 
 if TYPE_CHECKING:
     from builtins import type as pytype
-    from collections.abc import Callable, Iterator
+    from collections.abc import Iterator
     from typing import Any
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class VisibleField:
+    """A dataclass field exposed to GraphQL, with its normalized annotation metadata."""
+
+    dc_field: "dataclasses.Field[Any]"
+    annotation: "Any"
+    description: str | None
+    refs: "frozenset[pytype]"
+
+
 def _get_annotated_field_meta(annotation: "Any") -> Field | None:
     info = analyze_annotation(annotation)
     for item in info.metadata:
@@ -39,21 +50,6 @@ def _get_annotated_field_meta(annotation: "Any") -> Field | None:
     return None
 
 
-def _data_field_resolver(
-    field_name: str, *, has_default: bool, default: object | None
-) -> "Callable[[Any, Any, dict[str, Any]], Any]":
-    getter = attrgetter(field_name)
-    if not has_default:
-        return lambda self, _context, _kwargs: getter(self)
-
-    def _resolver(self: object, _context: object, _kwargs: dict[str, object]) -> object:
-        if self is None:
-            return default
-        return getter(self)
-
-    return _resolver
-
-
 def _resolve_data_field_default(
     dc_field: "dataclasses.Field[Any]",
 ) -> tuple[bool, object | None]:
@@ -64,8 +60,12 @@ def _resolve_data_field_default(
     return False, None
 
 
-def _iter_compiled_resolvers(cls: "pytype") -> list[CompiledResolverField]:
-    resolver_fields: list[CompiledResolverField] = []
+def _partition_compiled_resolvers(
+    cls: "pytype",
+) -> tuple[list[CompiledResolverField], list[CompiledResolverField]]:
+    """Split compiled resolvers into field and subscription lists in one MRO pass."""
+    field_resolvers: list[CompiledResolverField] = []
+    subscription_resolvers: list[CompiledResolverField] = []
     seen_attrs: set[str] = set()
     for source_cls in cls.__mro__:
         if source_cls is object:
@@ -75,9 +75,13 @@ def _iter_compiled_resolvers(cls: "pytype") -> list[CompiledResolverField]:
                 continue
             seen_attrs.add(attr_name)
             compiled = getattr(attr_value, COMPILED_RESOLVER_ATTR, None)
-            if isinstance(compiled, CompiledResolverField):
-                resolver_fields.append(compiled)
-    return resolver_fields
+            if not isinstance(compiled, CompiledResolverField):
+                continue
+            if compiled.kind is ResolverKind.SUBSCRIPTION:
+                subscription_resolvers.append(compiled)
+            else:
+                field_resolvers.append(compiled)
+    return field_resolvers, subscription_resolvers
 
 
 def _implemented_interfaces(
@@ -98,7 +102,7 @@ def _implemented_interfaces(
 
 def _iter_visible_dataclass_fields(
     cls: "pytype", hints: dict[str, "Any"]
-) -> "Iterator[tuple[dataclasses.Field[Any], Any, str | None, frozenset[pytype]]]":
+) -> "Iterator[VisibleField]":
     """Yield visible dataclass fields with normalized metadata used by all compile modes."""
     for dc_field in dataclasses.fields(cls):
         annotation = hints.get(dc_field.name, dc_field.type)
@@ -108,11 +112,13 @@ def _iter_visible_dataclass_fields(
         refs = frozenset(walk_annotation(annotation))
         field_meta = _get_annotated_field_meta(annotation)
         description = field_meta.description if field_meta else None
-        yield dc_field, annotation, description, refs
+        yield VisibleField(
+            dc_field=dc_field, annotation=annotation, description=description, refs=refs
+        )
 
 
 def _compile_subscription_fields(
-    visible_fields: "tuple[tuple[dataclasses.Field[Any], Any, str | None, frozenset[pytype]], ...]",
+    visible_fields: tuple[VisibleField, ...],
     subscription_resolvers: list[CompiledResolverField],
 ) -> tuple[CompiledResolverField, ...]:
     if visible_fields:
@@ -121,52 +127,54 @@ def _compile_subscription_fields(
 
 
 def _compile_input_fields(
-    visible_fields: "tuple[tuple[dataclasses.Field[Any], Any, str | None, frozenset[pytype]], ...]",
+    visible_fields: tuple[VisibleField, ...],
 ) -> tuple[CompiledInputField, ...]:
     fields: list[CompiledInputField] = []
-    for dc_field, annotation, desc, field_refs in visible_fields:
+    for visible in visible_fields:
+        dc_field = visible.dc_field
         force_nullable = (
             dc_field.default is not MISSING or dc_field.default_factory is not MISSING
         )
         type_spec = _type_spec_from_annotation(
-            annotation, expect_input=True, force_nullable=force_nullable
+            visible.annotation, expect_input=True, force_nullable=force_nullable
         )
-        default_value = _input_field_default(dc_field, annotation)
+        default_value = _input_field_default(dc_field, visible.annotation)
         has_default = default_value is not MISSING
         fields.append(
             CompiledInputField(
                 name=dc_field.name,
                 type_spec=type_spec,
-                description=desc,
+                description=visible.description,
                 has_default=has_default,
                 default=default_value if has_default else None,
-                refs=field_refs,
+                refs=visible.refs,
             )
         )
     return tuple(fields)
 
 
 def _compile_object_fields(
-    visible_fields: "tuple[tuple[dataclasses.Field[Any], Any, str | None, frozenset[pytype]], ...]",
+    visible_fields: tuple[VisibleField, ...],
     field_resolvers: list[CompiledResolverField],
 ) -> tuple[CompiledDataField | CompiledResolverField, ...]:
     fields: list[CompiledDataField | CompiledResolverField] = []
-    for dc_field, annotation, desc, field_refs in visible_fields:
+    for visible in visible_fields:
+        dc_field = visible.dc_field
         type_spec = _type_spec_from_annotation(
-            annotation, expect_input=False, force_nullable=dc_field.default is None
+            visible.annotation,
+            expect_input=False,
+            force_nullable=dc_field.default is None,
         )
         has_default, default = _resolve_data_field_default(dc_field)
         fields.append(
             CompiledDataField(
                 name=dc_field.name,
                 type_spec=type_spec,
-                description=desc,
+                description=visible.description,
                 has_default=has_default,
                 default=default,
-                resolver_func=_data_field_resolver(
-                    dc_field.name, has_default=has_default, default=default
-                ),
-                refs=field_refs,
+                resolver_func=attrgetter(dc_field.name),
+                refs=visible.refs,
             )
         )
     fields.extend(field_resolvers)
@@ -177,18 +185,13 @@ def compile_type_definition(
     cls: "pytype", *, kind: TypeKind, name: str | None, description: str | None
 ) -> CompiledType:
     """Compile a decorated class into immutable metadata used at schema build time."""
-    type_name = name or cls.__name__
+    type_name = sys.intern(name or cls.__name__)
     hints = get_annotations(cls)
-    resolvers = _iter_compiled_resolvers(cls)
-
-    field_resolvers = [resolver for resolver in resolvers if resolver.kind == "field"]
-    subscription_resolvers = [
-        resolver for resolver in resolvers if resolver.kind == "subscription"
-    ]
+    field_resolvers, subscription_resolvers = _partition_compiled_resolvers(cls)
 
     resolved_kind = kind
     if kind is TypeKind.INPUT:
-        if resolvers:
+        if field_resolvers or subscription_resolvers:
             raise input_field_resolver_not_allowed()
     else:
         if field_resolvers and subscription_resolvers:
@@ -203,9 +206,7 @@ def compile_type_definition(
             resolved_kind = TypeKind.SUBSCRIPTION
 
     visible_fields = tuple(_iter_visible_dataclass_fields(cls, hints))
-    visible_field_names = {
-        dc_field.name for dc_field, _ann, _desc, _refs in visible_fields
-    }
+    visible_field_names = {visible.dc_field.name for visible in visible_fields}
     field_resolvers = [
         resolver
         for resolver in field_resolvers
@@ -213,8 +214,8 @@ def compile_type_definition(
     ]
 
     refs: list[pytype] = []
-    for _dc_field, _annotation, _desc, field_refs in visible_fields:
-        refs.extend(field_refs)
+    for visible in visible_fields:
+        refs.extend(visible.refs)
 
     implements: tuple[str, ...] = ()
     if resolved_kind in {TypeKind.OBJECT, TypeKind.INTERFACE}:
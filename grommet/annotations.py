@@ -30,6 +30,13 @@ if TYPE_CHECKING:
     from typing import Any
 
 _NONE_TYPE = type(None)
+_SCALAR_NAMES = frozenset(_SCALARS.values())
+_SCALAR_SPECS = {
+    (scalar, nullable): TypeSpec(kind="named", name=name, nullable=nullable)
+    for scalar, name in _SCALARS.items()
+    for nullable in (False, True)
+}
+_TYPE_SPEC_CACHE: dict[tuple["Any", bool, bool], TypeSpec] = {}
 
 
 @dataclass(frozen=True, slots=True)
@@ -106,8 +113,12 @@ def analyze_annotation(annotation: "Any") -> AnnotationInfo:
     is_async_iterable = origin in (AsyncIterator, AsyncIterable)
     async_item = _unwrap_type_alias(args[0]) if is_async_iterable and args else None
     is_classvar = origin is ClassVar
-    is_hidden = any(x is Hidden for x in metadata)
-    is_context = any(x is Context for x in metadata)
+    is_hidden = is_context = False
+    for item in metadata:
+        if item is Hidden:
+            is_hidden = True
+        elif item is Context:
+            is_context = True
     return AnnotationInfo(
         inner=inner,
         optional=optional,
@@ -186,6 +197,33 @@ def _walk_inner(inner: "Any") -> "Iterator[pytype]":
 
 def _type_spec_from_annotation(
     annotation: "Any", *, expect_input: bool, force_nullable: bool = False
+) -> TypeSpec:
+    """Build a TypeSpec, reusing specs for scalar-only annotations across the process."""
+    key = (annotation, expect_input, force_nullable)
+    cacheable = True
+    try:
+        cached = _TYPE_SPEC_CACHE.get(key)
+    except TypeError:
+        cached, cacheable = None, False
+    if cached is not None:
+        return cached
+    type_spec = _build_type_spec(
+        annotation, expect_input=expect_input, force_nullable=force_nullable
+    )
+    # grommet type names can change on re-decoration, so only scalar specs are shared.
+    if cacheable and _is_scalar_type_spec(type_spec):
+        _TYPE_SPEC_CACHE[key] = type_spec
+    return type_spec
+
+
+def _is_scalar_type_spec(type_spec: TypeSpec) -> bool:
+    while type_spec.of_type is not None:
+        type_spec = type_spec.of_type
+    return type_spec.kind == "named" and type_spec.name in _SCALAR_NAMES
+
+
+def _build_type_spec(
+    annotation: "Any", *, expect_input: bool, force_nullable: bool
 ) -> TypeSpec:
     info = analyze_annotation(annotation)
     if info.is_context:
@@ -211,8 +249,9 @@ def _type_spec_from_annotation(
     )
     if union_spec is not None:
         return union_spec
-    if inner in _SCALARS:
-        return TypeSpec(kind="named", name=_SCALARS[inner], nullable=nullable)
+    scalar_spec = _SCALAR_SPECS.get((inner, nullable))
+    if scalar_spec is not None:
+        return scalar_spec
     if _is_grommet_type(inner):
         type_meta = _get_type_meta(inner)
         if expect_input and type_meta.kind is not TypeKind.INPUT:
@@ -1,4 +1,5 @@
 import dataclasses
+from functools import partial
 from typing import TYPE_CHECKING
 
 from .annotations import _is_input_type, analyze_annotation
@@ -57,14 +58,24 @@ def _arg_coercer(annotation: "Any") -> "Callable[[Any], Any] | None":
             return lambda value: None if value is None else inner_coercer(value)
         return None
     if _is_input_type(inner):
-        return lambda value: _coerce_input(value, inner)
+        return partial(_coerce_input, cls=inner)
     return None
 
 
+def _direct_input_type(annotation: "Any") -> type | None:
+    """Return the input dataclass for a bare non-null input type annotation."""
+    info = analyze_annotation(annotation)
+    if info.is_list or info.optional or not _is_input_type(info.inner):
+        return None
+    input_type: type = info.inner
+    return input_type
+
+
 def _coerce_input(value: "Any", cls: type) -> "Any":
     """Convert a dict to an input type dataclass instance."""
-    if isinstance(value, cls):
-        return value
+    # Rust hands argument values over as dicts, so check that first.
     if isinstance(value, dict):
         return cls(**value)
+    if isinstance(value, cls):
+        return value
     raise input_mapping_expected(cls.__name__)
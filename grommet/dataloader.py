@@ -0,0 +1,67 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+from .errors import dataloader_result_count_mismatch
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable, Sequence
+
+
+class DataLoader[K: "Hashable", V]:
+    """Batches and caches the keys loaded within one event loop iteration."""
+
+    __slots__ = ("_batch_fn", "_futures", "_pending", "_tasks")
+
+    def __init__(self, batch_fn: "Callable[[list[K]], Awaitable[Sequence[V]]]") -> None:
+        self._batch_fn = batch_fn
+        self._futures: dict[K, asyncio.Future[V]] = {}
+        self._pending: list[tuple[K, asyncio.Future[V]]] = []
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def load(self, key: K) -> "Awaitable[V]":
+        """Returns an awaitable for the value of `key`, batched with its sibling loads."""
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._futures[key] = loop.create_future()
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            self._pending.append((key, future))
+        # Waiters share the cached future, so each gets a shield of its own.
+        return asyncio.shield(future)
+
+    def clear(self, key: K) -> None:
+        """Forgets the cached result for `key` so the next load fetches it again."""
+        self._futures.pop(key, None)
+
+    def _dispatch(self) -> None:
+        batch, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: list[tuple[K, asyncio.Future[V]]]) -> None:
+        keys = [key for key, _ in batch]
+        try:
+            values = await self._batch_fn(keys)
+            if len(values) != len(keys):
+                raise dataloader_result_count_mismatch(len(keys), len(values))
+        except Exception as exc:
+            self._forget(batch)
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+        except BaseException:
+            self._forget(batch)
+            for _, future in batch:
+                future.cancel()
+            raise
+
+        for (_, future), value in zip(batch, values, strict=True):
+            future.set_result(value)
+
+    def _forget(self, batch: list[tuple[K, asyncio.Future[V]]]) -> None:
+        # Failed keys are dropped, unless already reloaded, so a later load retries them.
+        for key, future in batch:
+            if self._futures.get(key) is future:
+                del self._futures[key]
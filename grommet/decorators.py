@@ -5,7 +5,7 @@ from ._compiled import COMPILED_RESOLVER_ATTR, REFS_ATTR
 from ._resolver_compiler import compile_resolver_field
 from ._type_compiler import compile_type_definition
 from .errors import GrommetTypeError, dataclass_required, decorator_requires_callable
-from .metadata import TypeKind
+from .metadata import ResolverKind, TypeKind
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -146,7 +146,10 @@ def field(
 
         field_name = name or target.__name__
         compiled = compile_resolver_field(
-            target, field_name=field_name, description=description, kind="field"
+            target,
+            field_name=field_name,
+            description=description,
+            kind=ResolverKind.FIELD,
         )
         setattr(target, COMPILED_RESOLVER_ATTR, compiled)
         setattr(target, REFS_ATTR, compiled.refs)
@@ -183,7 +186,10 @@ def subscription(
 
         field_name = name or target.__name__
         compiled = compile_resolver_field(
-            target, field_name=field_name, description=description, kind="subscription"
+            target,
+            field_name=field_name,
+            description=description,
+            kind=ResolverKind.SUBSCRIPTION,
         )
         setattr(target, COMPILED_RESOLVER_ATTR, compiled)
         setattr(target, REFS_ATTR, compiled.refs)
@@ -92,3 +92,9 @@ def union_definition_conflict(union_name: str) -> GrommetTypeError:
     return GrommetTypeError(
         f"Union '{union_name}' has conflicting definitions across the schema graph."
     )
+
+
+def dataloader_result_count_mismatch(expected: int, actual: int) -> GrommetTypeError:
+    return GrommetTypeError(
+        f"DataLoader batch function returned {actual} values for {expected} keys."
+    )
@@ -25,6 +25,11 @@ class Union:
     description: str | None = None
 
 
+class ResolverKind(enum.Enum):
+    FIELD = "field"
+    SUBSCRIPTION = "subscription"
+
+
 class TypeKind(enum.Enum):
     OBJECT = "object"
     INPUT = "input"
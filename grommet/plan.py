@@ -27,7 +27,7 @@ class SchemaBundle:
     query: str
     mutation: str | None
     subscription: str | None
-    types: list[CompiledType | CompiledUnion]
+    types: tuple[CompiledType | CompiledUnion, ...]
 
 
 def build_schema_graph(
@@ -44,10 +44,10 @@ def build_schema_graph(
 
     collected_classes = _walk_and_collect(query, mutation, subscription)
     compiled_types = [_get_compiled_type(cls) for cls in collected_classes]
-    types: list[CompiledType | CompiledUnion] = [
+    types: tuple[CompiledType | CompiledUnion, ...] = (
         *compiled_types,
         *_collect_compiled_unions(compiled_types),
-    ]
+    )
 
     return SchemaBundle(
         query=_get_type_meta(query).name,
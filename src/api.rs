@@ -1,21 +1,35 @@
-use std::sync::Arc;
+use std::collections::HashMap;
 use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::{Arc, PoisonError};
 
 use async_graphql::dynamic::Schema;
 use async_graphql::futures_util::lock::Mutex;
 use async_graphql::futures_util::stream::{BoxStream, StreamExt};
-use async_graphql::parser::{parse_query, types::OperationType};
-use async_graphql::{Request, Variables};
+use async_graphql::parser::parse_query;
+use async_graphql::parser::types::{ExecutableDocument, OperationType};
+use async_graphql::{Request, Response, ServerError, Variables};
 use pyo3::exceptions::PyStopAsyncIteration;
+use pyo3::intern;
 use pyo3::prelude::*;
+use pyo3::sync::PyOnceLock;
+use pyo3::types::PyString;
 
 use crate::schema_types::register_schema;
 use crate::types::{ContextValue, PyObj};
 use crate::values::{py_to_value, response_to_py};
 
+// Upper bound on cached parsed documents per schema, so unbounded streams of distinct
+// ad-hoc queries cannot grow the cache without limit.
+const DOCUMENT_CACHE_CAPACITY: usize = 256;
+// Queries longer than this are parsed per request rather than kept as cache keys.
+const DOCUMENT_CACHE_MAX_QUERY_LEN: usize = 16 * 1024;
+
 #[pyclass(module = "grommet._core", name = "Schema")]
 pub(crate) struct SchemaWrapper {
     schema: Arc<Schema>,
+    has_subscription: bool,
+    documents: std::sync::Mutex<HashMap<String, ExecutableDocument>>,
+    sdl: PyOnceLock<Py<PyString>>,
 }
 
 impl SchemaWrapper {
@@ -46,10 +60,41 @@ impl SchemaWrapper {
         Ok(request)
     }
 
-    fn is_subscription(query: &str) -> bool {
-        let Ok(doc) = parse_query(query) else {
+    // Parse each distinct query text once per schema. Repeated operations clone the
+    // cached document, which is cheaper than a parse, and hand it to async-graphql so
+    // execution skips parsing too. Parse errors convert exactly as async-graphql's own.
+    fn parsed_document(&self, query: &str) -> Result<ExecutableDocument, ServerError> {
+        if query.len() > DOCUMENT_CACHE_MAX_QUERY_LEN {
+            return Ok(parse_query(query)?);
+        }
+        if let Some(doc) = self
+            .documents
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+            .get(query)
+        {
+            return Ok(doc.clone());
+        }
+        let doc = parse_query(query)?;
+        let mut documents = self
+            .documents
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner);
+        if documents.len() >= DOCUMENT_CACHE_CAPACITY {
+            // Evict a single arbitrary entry so the rest of the hot set stays cached.
+            let evicted = documents.keys().next().cloned();
+            if let Some(evicted) = evicted {
+                documents.remove(&evicted);
+            }
+        }
+        documents.insert(query.to_owned(), doc.clone());
+        Ok(doc)
+    }
+
+    fn is_subscription(&self, doc: &ExecutableDocument) -> bool {
+        if !self.has_subscription {
             return false;
-        };
+        }
         for (_name, op) in doc.operations.iter() {
             if op.node.ty == OperationType::Subscription {
                 return true;
@@ -77,11 +122,18 @@ impl SchemaWrapper {
         )?;
         Ok(SchemaWrapper {
             schema: Arc::new(schema),
+            has_subscription: subscription.is_some(),
+            documents: std::sync::Mutex::new(HashMap::new()),
+            sdl: PyOnceLock::new(),
         })
     }
 
-    fn as_sdl(&self) -> PyResult<String> {
-        Ok(self.schema.sdl())
+    // The registered schema is immutable, so the SDL is rendered once and the same
+    // Python string is handed out on every later call.
+    fn as_sdl(&self, py: Python<'_>) -> Py<PyString> {
+        self.sdl
+            .get_or_init(py, || PyString::new(py, &self.schema.sdl()).unbind())
+            .clone_ref(py)
     }
 
     async fn execute(
@@ -90,8 +142,18 @@ impl SchemaWrapper {
         variables: Option<Py<PyAny>>,
         context: Option<Py<PyAny>>,
     ) -> PyResult<Py<PyAny>> {
-        let is_sub = Self::is_subscription(&query);
-        let request = Self::build_request(query, variables, context)?;
+        let document = self.parsed_document(&query);
+        let mut request = Self::build_request(query, variables, context)?;
+        // The query was already parsed once, so report a failure here instead of letting
+        // async-graphql parse it a second time.
+        let document = match document {
+            Ok(doc) => doc,
+            Err(err) => {
+                return Python::attach(|py| response_to_py(py, Response::from_errors(vec![err])));
+            }
+        };
+        let is_sub = self.is_subscription(&document);
+        request.set_parsed_query(document);
         let schema = self.schema.clone();
 
         if is_sub {
@@ -123,7 +185,7 @@ impl SubscriptionStream {
     fn __anext__<'py>(slf: PyRef<'py, Self>) -> PyResult<Bound<'py, PyAny>> {
         let py = slf.py();
         let slf_obj: Py<Self> = slf.into();
-        slf_obj.bind(py).call_method0("_anext_impl")
+        slf_obj.bind(py).call_method0(intern!(py, "_anext_impl"))
     }
 
     #[pyo3(name = "_anext_impl")]
@@ -7,8 +7,10 @@ use async_graphql::Error;
 use async_graphql::dynamic::{FieldValue, ResolverContext, TypeRef};
 use async_graphql::futures_util::stream::{self, BoxStream, StreamExt};
 use pyo3::exceptions::PyStopAsyncIteration;
+use pyo3::intern;
 use pyo3::prelude::*;
-use pyo3::types::{PyAnyMethods, PyCFunction, PyDict, PyTupleMethods};
+use pyo3::sync::PyOnceLock;
+use pyo3::types::{PyAnyMethods, PyCFunction, PyTuple, PyTupleMethods};
 
 use crate::errors::{py_err_to_error, subscription_requires_async_iterator};
 use crate::types::{ContextValue, FieldContext, PyObj, ResolverEntry};
@@ -41,37 +43,40 @@ impl PythonAwaitableFuture {
         }
     }
 
+    // Starts the awaitable as an eager task when the loop has no task factory of its own,
+    // so coroutines that finish without suspending never round-trip through the loop.
     fn start(&self) -> PyResult<()> {
         let callback_state = Arc::clone(&self.state);
 
-        let task = Python::attach(|py| -> PyResult<Py<PyAny>> {
-            let asyncio = py.import("asyncio")?;
-            let task = match asyncio.call_method1("create_task", (self.awaitable.bind(py),)) {
+        let task = Python::attach(|py| -> PyResult<Option<Py<PyAny>>> {
+            let (get_running_loop, eager_task_factory) = asyncio_task_functions(py)?;
+            let awaitable = self.awaitable.bind(py);
+            let task = match get_running_loop.call0().and_then(|event_loop| {
+                if event_loop.call_method0("get_task_factory")?.is_none() {
+                    eager_task_factory.call1((event_loop, awaitable))
+                } else {
+                    event_loop.call_method1("create_task", (awaitable,))
+                }
+            }) {
                 Ok(task) => task,
                 Err(err) => {
-                    let _ = self.awaitable.bind(py).call_method0("close");
+                    let _ = awaitable.call_method0("close");
                     return Err(err);
                 }
             };
+            if task.call_method0("done")?.is_truthy()? {
+                let result = task_outcome(&task);
+                let mut shared = self.state.lock().expect("awaitable state poisoned");
+                shared.result = Some(result);
+                return Ok(None);
+            }
             let callback = PyCFunction::new_closure(
                 py,
                 Some(c"grommet_awaitable_done"),
                 None,
                 move |args, _kwargs| -> PyResult<()> {
                     let task = args.get_item(0)?;
-                    let result = if task.call_method0("cancelled")?.is_truthy()? {
-                        let cancelled = task
-                            .py()
-                            .import("asyncio")?
-                            .getattr("CancelledError")?
-                            .call0()?;
-                        Err(PyErr::from_value(cancelled))
-                    } else {
-                        match task.call_method0("result") {
-                            Ok(value) => Ok(value.unbind()),
-                            Err(err) => Err(err),
-                        }
-                    };
+                    let result = task_outcome(&task);
 
                     let mut shared = callback_state.lock().expect("awaitable state poisoned");
                     shared.task = None;
@@ -83,15 +88,45 @@ impl PythonAwaitableFuture {
                 },
             )?;
             task.call_method1("add_done_callback", (callback,))?;
-            Ok(task.unbind())
+            Ok(Some(task.unbind()))
         })?;
 
         let mut shared = self.state.lock().expect("awaitable state poisoned");
-        shared.task = Some(task);
+        shared.task = task;
         Ok(())
     }
 }
 
+// Every async resolver starts a task, so resolve the asyncio entry points once instead of
+// importing the module and looking both attributes up per field.
+fn asyncio_task_functions(py: Python<'_>) -> PyResult<(Bound<'_, PyAny>, Bound<'_, PyAny>)> {
+    static ASYNCIO_TASK_FUNCTIONS: PyOnceLock<(Py<PyAny>, Py<PyAny>)> = PyOnceLock::new();
+    let (get_running_loop, eager_task_factory) =
+        ASYNCIO_TASK_FUNCTIONS.get_or_try_init(py, || -> PyResult<(Py<PyAny>, Py<PyAny>)> {
+            let asyncio = py.import("asyncio")?;
+            Ok((
+                asyncio.getattr("get_running_loop")?.unbind(),
+                asyncio.getattr("eager_task_factory")?.unbind(),
+            ))
+        })?;
+    Ok((
+        get_running_loop.bind(py).clone(),
+        eager_task_factory.bind(py).clone(),
+    ))
+}
+
+fn task_outcome(task: &Bound<'_, PyAny>) -> PyResult<Py<PyAny>> {
+    if task.call_method0("cancelled")?.is_truthy()? {
+        let cancelled = task
+            .py()
+            .import("asyncio")?
+            .getattr("CancelledError")?
+            .call0()?;
+        return Err(PyErr::from_value(cancelled));
+    }
+    Ok(task.call_method0("result")?.unbind())
+}
+
 impl Future for PythonAwaitableFuture {
     type Output = PyResult<Py<PyAny>>;
 
@@ -116,6 +151,19 @@ impl Future for PythonAwaitableFuture {
             if let Some(waker) = shared.waker.take() {
                 waker.wake();
             }
+            return Poll::Pending;
+        }
+
+        // An eager task that finished during `start` has already stored its result.
+        if should_start
+            && let Some(result) = self
+                .state
+                .lock()
+                .expect("awaitable state poisoned")
+                .result
+                .take()
+        {
+            return Poll::Ready(result);
         }
 
         Poll::Pending
@@ -173,17 +221,22 @@ pub(crate) async fn resolve_subscription_stream<'a>(
 ) -> Result<BoxStream<'a, Result<FieldValue<'a>, Error>>, Error> {
     let entry = field_ctx.resolver.as_ref().expect("resolver missing");
     let value = resolve_with_resolver(&ctx, entry).await?;
-    let iterator =
-        Python::attach(|py| subscription_iterator(value.bind(py))).map_err(py_err_to_error)?;
+    // Entries built from async generator functions (every compiled subscription) return
+    // their own iterator, so only other callables need the async-iterator probe.
+    let iterator = if entry.is_async_gen {
+        PyObj::new(value)
+    } else {
+        Python::attach(|py| subscription_iterator(value.bind(py))).map_err(py_err_to_error)?
+    };
     subscription_stream(iterator, field_ctx.output_type.clone())
 }
 
 fn subscription_iterator(value_ref: &Bound<'_, PyAny>) -> PyResult<PyObj> {
-    if value_ref.hasattr("__aiter__")? {
+    if value_ref.hasattr("__anext__")? {
+        Ok(PyObj::new(value_ref.clone().unbind()))
+    } else if value_ref.hasattr("__aiter__")? {
         let iter = value_ref.call_method0("__aiter__")?;
         Ok(PyObj::new(iter.unbind()))
-    } else if value_ref.hasattr("__anext__")? {
-        Ok(PyObj::new(value_ref.clone().unbind()))
     } else {
         Err(subscription_requires_async_iterator())
     }
@@ -197,7 +250,7 @@ fn subscription_stream<'a>(
         let output_type = output_type.clone();
         async move {
             let next_fut: BoxFut = Python::attach(|py| {
-                let anext = iterator.bind(py).call_method0("__anext__")?;
+                let anext = iterator.bind(py).call_method0(intern!(py, "__anext__"))?;
                 Ok(awaitable_into_future(anext))
             })
             .map_err(py_err_to_error)?;
@@ -272,13 +325,30 @@ fn call_resolver_sync(
     call_resolver(py, ctx, entry, parent.as_ref(), context.as_ref())
 }
 
-fn build_kwargs<'py>(py: Python<'py>, ctx: &ResolverContext<'_>) -> PyResult<Bound<'py, PyDict>> {
-    let kwargs = PyDict::new(py);
-    for (name, value) in ctx.args.iter() {
-        let py_value = value_to_py_bound(py, value.as_value())?;
-        kwargs.set_item(name.as_str(), py_value)?;
+fn dataclasses_missing(py: Python<'_>) -> PyResult<Bound<'_, PyAny>> {
+    static DATACLASSES_MISSING: PyOnceLock<Py<PyAny>> = PyOnceLock::new();
+    let missing = DATACLASSES_MISSING.get_or_try_init(py, || -> PyResult<Py<PyAny>> {
+        Ok(py.import("dataclasses")?.getattr("MISSING")?.unbind())
+    })?;
+    Ok(missing.bind(py).clone())
+}
+
+// Lays arguments out positionally in compiled `args` order so the adapter indexes
+// instead of hashing names; omitted arguments are passed as `dataclasses.MISSING`.
+fn build_args<'py>(
+    py: Python<'py>,
+    ctx: &ResolverContext<'_>,
+    arg_names: &[String],
+) -> PyResult<Bound<'py, PyTuple>> {
+    let mut values = Vec::with_capacity(arg_names.len());
+    for name in arg_names {
+        let value = match ctx.args.get(name) {
+            Some(value) => value_to_py_bound(py, value.as_value())?,
+            None => dataclasses_missing(py)?,
+        };
+        values.push(value);
     }
-    Ok(kwargs)
+    PyTuple::new(py, values)
 }
 
 fn call_resolver(
@@ -288,10 +358,18 @@ fn call_resolver(
     parent: Option<&PyObj>,
     context: Option<&PyObj>,
 ) -> PyResult<Py<PyAny>> {
-    let parent_obj: Py<PyAny> = match parent {
-        Some(p) => p.clone_ref(py),
-        None => py.None(),
+    let parent_obj: Py<PyAny> = match (parent, &entry.parent_default) {
+        (Some(p), _) => p.clone_ref(py),
+        // Data fields with a default resolve to it when there is no parent object.
+        (None, Some(default)) => return Ok(default.clone_ref(py)),
+        (None, None) => py.None(),
     };
+    let func = entry.func.bind(py);
+    // Self-only resolvers (data fields and argument-free resolvers) take just the parent,
+    // so skip the context lookup and building per-call arguments entirely.
+    if entry.self_only {
+        return Ok(func.call1((parent_obj,))?.unbind());
+    }
     let context_obj: Py<PyAny> = if entry.needs_context {
         match context {
             Some(value) => value.clone_ref(py),
@@ -300,7 +378,11 @@ fn call_resolver(
     } else {
         py.None()
     };
-    let kwargs = build_kwargs(py, ctx)?;
-    let func = entry.func.bind(py);
-    Ok(func.call1((parent_obj, context_obj, kwargs))?.unbind())
+    // Context-only adapters never read their arguments, so don't build an empty tuple.
+    let args: Py<PyAny> = if entry.arg_names.is_empty() {
+        py.None()
+    } else {
+        build_args(py, ctx, &entry.arg_names)?.into_any().unbind()
+    };
+    Ok(func.call1((parent_obj, context_obj, args))?.unbind())
 }
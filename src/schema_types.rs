@@ -6,7 +6,7 @@ use async_graphql::dynamic::{
     Union,
 };
 use pyo3::prelude::*;
-use pyo3::types::PyAnyMethods;
+use pyo3::types::{PyAnyMethods, PyTuple, PyTupleMethods};
 
 use crate::errors::{py_type_error, py_value_error};
 use crate::resolver::{resolve_field, resolve_field_sync_fast, resolve_subscription_stream};
@@ -42,6 +42,9 @@ fn build_field_context(
     func: Py<PyAny>,
     needs_context: bool,
     is_async_gen: bool,
+    self_only: bool,
+    arg_names: Vec<String>,
+    parent_default: Option<PyObj>,
     output_type: &TypeRef,
 ) -> PyResult<Arc<FieldContext>> {
     Ok(Arc::new(FieldContext {
@@ -49,11 +52,23 @@ fn build_field_context(
             func: PyObj::new(func),
             needs_context,
             is_async_gen,
+            self_only,
+            arg_names,
+            parent_default,
         }),
         output_type: output_type.clone(),
     }))
 }
 
+fn arg_names(py: Python<'_>, args: &[Py<PyAny>]) -> PyResult<Vec<String>> {
+    let mut names = Vec::with_capacity(args.len());
+    for arg in args {
+        let name: String = arg.bind(py).getattr("name")?.extract()?;
+        names.push(name);
+    }
+    Ok(names)
+}
+
 fn default_value_from_payload<'py>(
     payload: &Bound<'py, PyAny>,
 ) -> PyResult<Option<Bound<'py, PyAny>>> {
@@ -124,6 +139,17 @@ fn build_interface_field(py: Python<'_>, field: &Bound<'_, PyAny>) -> PyResult<I
     Ok(interface_field)
 }
 
+// Sync fields (data fields and sync or syncified resolvers) are chosen once at schema build
+// and resolve inline as ready values, never allocating a future on the success path.
+fn sync_field(name: String, type_ref: TypeRef, field_ctx: Arc<FieldContext>) -> Field {
+    Field::new(name, type_ref, move |ctx| {
+        match resolve_field_sync_fast(&ctx, &field_ctx) {
+            Ok(value) => FieldFuture::Value(Some(value)),
+            Err(err) => FieldFuture::new(async move { Err::<Option<FieldValue<'_>>, _>(err) }),
+        }
+    })
+}
+
 fn build_object_field(py: Python<'_>, field: &Bound<'_, PyAny>) -> PyResult<Field> {
     let name: String = field.getattr("name")?.extract()?;
     let type_spec = field.getattr("type_spec")?;
@@ -133,36 +159,47 @@ fn build_object_field(py: Python<'_>, field: &Bound<'_, PyAny>) -> PyResult<Fiel
 
     let mut graphql_field = if is_data_field {
         let func: Py<PyAny> = field.getattr("resolver_func")?.extract()?;
-        let field_ctx = build_field_context(func, false, false, &type_ref)?;
-        Field::new(name, type_ref, move |ctx| {
-            let result = resolve_field_sync_fast(&ctx, &field_ctx);
-            match result {
-                Ok(value) => FieldFuture::Value(Some(value)),
-                Err(err) => FieldFuture::new(async move { Err::<Option<FieldValue<'_>>, _>(err) }),
-            }
-        })
+        let has_default: bool = field.getattr("has_default")?.extract()?;
+        let parent_default = if has_default {
+            Some(PyObj::new(field.getattr("default")?.unbind()))
+        } else {
+            None
+        };
+        let field_ctx = build_field_context(
+            func,
+            false,
+            false,
+            true,
+            Vec::new(),
+            parent_default,
+            &type_ref,
+        )?;
+        sync_field(name, type_ref, field_ctx)
     } else {
         let func: Py<PyAny> = field.getattr("func")?.extract()?;
         let needs_context: bool = field.getattr("needs_context")?.extract()?;
+        let self_only: bool = field.getattr("self_only")?.extract()?;
         let is_async: bool = field.getattr("is_async")?.extract()?;
-        let field_ctx = build_field_context(func, needs_context, false, &type_ref)?;
-
-        let mut graphql_field = Field::new(name, type_ref, move |ctx| {
-            if is_async {
+        let args: Vec<Py<PyAny>> = field.getattr("args")?.extract()?;
+        let field_ctx = build_field_context(
+            func,
+            needs_context,
+            false,
+            self_only,
+            arg_names(py, &args)?,
+            None,
+            &type_ref,
+        )?;
+
+        let mut graphql_field = if is_async {
+            Field::new(name, type_ref, move |ctx| {
                 let field_ctx = field_ctx.clone();
                 FieldFuture::new(async move { resolve_field(ctx, field_ctx).await })
-            } else {
-                let result = resolve_field_sync_fast(&ctx, &field_ctx);
-                match result {
-                    Ok(value) => FieldFuture::Value(Some(value)),
-                    Err(err) => {
-                        FieldFuture::new(async move { Err::<Option<FieldValue<'_>>, _>(err) })
-                    }
-                }
-            }
-        });
+            })
+        } else {
+            sync_field(name, type_ref, field_ctx)
+        };
 
-        let args: Vec<Py<PyAny>> = field.getattr("args")?.extract()?;
         for arg in &args {
             let iv = build_argument_input_value(arg.bind(py))?;
             graphql_field = graphql_field.argument(iv);
@@ -187,8 +224,18 @@ fn build_subscription_field(
     let type_ref = type_spec_to_type_ref(&type_spec)?;
     let func: Py<PyAny> = field.getattr("func")?.extract()?;
     let needs_context: bool = field.getattr("needs_context")?.extract()?;
+    let self_only: bool = field.getattr("self_only")?.extract()?;
     let description: Option<String> = field.getattr("description")?.extract()?;
-    let field_ctx = build_field_context(func, needs_context, true, &type_ref)?;
+    let args: Vec<Py<PyAny>> = field.getattr("args")?.extract()?;
+    let field_ctx = build_field_context(
+        func,
+        needs_context,
+        true,
+        self_only,
+        arg_names(py, &args)?,
+        None,
+        &type_ref,
+    )?;
 
     let mut graphql_field = SubscriptionField::new(name, type_ref, move |ctx| {
         let field_ctx = field_ctx.clone();
@@ -197,7 +244,6 @@ fn build_subscription_field(
         )
     });
 
-    let args: Vec<Py<PyAny>> = field.getattr("args")?.extract()?;
     for arg in &args {
         let iv = build_argument_input_value(arg.bind(py))?;
         graphql_field = graphql_field.argument(iv);
@@ -210,6 +256,14 @@ fn build_subscription_field(
     Ok(graphql_field)
 }
 
+// Borrow a compiled type's field tuple without copying it into a Rust vector.
+fn compiled_fields<'py>(
+    compiled_type: &Bound<'py, PyAny>,
+    attr: &str,
+) -> PyResult<Bound<'py, PyTuple>> {
+    Ok(compiled_type.getattr(attr)?.cast_into::<PyTuple>()?)
+}
+
 fn build_object_type(
     py: Python<'_>,
     compiled_type: &Bound<'_, PyAny>,
@@ -221,9 +275,8 @@ fn build_object_type(
         object = object.description(description);
     }
 
-    let fields: Vec<Py<PyAny>> = compiled_type.getattr("object_fields")?.extract()?;
-    for field in &fields {
-        object = object.field(build_object_field(py, field.bind(py))?);
+    for field in compiled_fields(compiled_type, "object_fields")?.iter() {
+        object = object.field(build_object_field(py, &field)?);
     }
 
     let implements: Vec<String> = compiled_type.getattr("implements")?.extract()?;
@@ -245,9 +298,8 @@ fn build_interface_type(
         interface = interface.description(description);
     }
 
-    let fields: Vec<Py<PyAny>> = compiled_type.getattr("object_fields")?.extract()?;
-    for field in &fields {
-        interface = interface.field(build_interface_field(py, field.bind(py))?);
+    for field in compiled_fields(compiled_type, "object_fields")?.iter() {
+        interface = interface.field(build_interface_field(py, &field)?);
     }
 
     let implements: Vec<String> = compiled_type.getattr("implements")?.extract()?;
@@ -259,7 +311,6 @@ fn build_interface_type(
 }
 
 fn build_input_object_type(
-    py: Python<'_>,
     compiled_type: &Bound<'_, PyAny>,
     type_name: &str,
     description: Option<&str>,
@@ -269,9 +320,8 @@ fn build_input_object_type(
         input_object = input_object.description(description);
     }
 
-    let fields: Vec<Py<PyAny>> = compiled_type.getattr("input_fields")?.extract()?;
-    for field in &fields {
-        input_object = input_object.field(build_input_field_value(field.bind(py))?);
+    for field in compiled_fields(compiled_type, "input_fields")?.iter() {
+        input_object = input_object.field(build_input_field_value(&field)?);
     }
 
     Ok(input_object)
@@ -288,9 +338,8 @@ fn build_subscription_type(
         subscription = subscription.description(description);
     }
 
-    let fields: Vec<Py<PyAny>> = compiled_type.getattr("subscription_fields")?.extract()?;
-    for field in &fields {
-        subscription = subscription.field(build_subscription_field(py, field.bind(py))?);
+    for field in compiled_fields(compiled_type, "subscription_fields")?.iter() {
+        subscription = subscription.field(build_subscription_field(py, &field)?);
     }
 
     Ok(subscription)
@@ -358,7 +407,6 @@ fn decode_registrable_type(
             description.as_deref(),
         )?)),
         "input" => Ok(RegistrableType::InputObject(build_input_object_type(
-            py,
             compiled_type,
             &type_name,
             description.as_deref(),
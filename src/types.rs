@@ -32,6 +32,9 @@ pub(crate) struct ResolverEntry {
     pub(crate) func: PyObj,
     pub(crate) needs_context: bool,
     pub(crate) is_async_gen: bool,
+    pub(crate) self_only: bool,
+    pub(crate) arg_names: Vec<String>,
+    pub(crate) parent_default: Option<PyObj>,
 }
 
 #[derive(Clone)]
@@ -1,9 +1,11 @@
+use std::collections::HashMap;
+
 use async_graphql::dynamic::{FieldValue, TypeRef};
 use async_graphql::{Name, Value};
 use pyo3::IntoPyObject;
 use pyo3::prelude::*;
 use pyo3::sync::PyOnceLock;
-use pyo3::types::{PyAnyMethods, PyBytes, PyDict, PyList};
+use pyo3::types::{PyAnyMethods, PyBytes, PyDict, PyList, PyString, PyType};
 
 use crate::errors::{expected_list_value, py_value_error, unsupported_value_type};
 use crate::types::PyObj;
@@ -88,8 +90,7 @@ fn meta_kind_value(meta: &Bound<'_, PyAny>) -> PyResult<Option<String>> {
     Ok(Some(kind.extract()?))
 }
 
-fn grommet_object_type_name(value: &Bound<'_, PyAny>) -> PyResult<Option<String>> {
-    let ty = value.get_type();
+fn grommet_object_type_name(ty: &Bound<'_, PyType>) -> PyResult<Option<String>> {
     if !ty.hasattr("__grommet_meta__")? {
         return Ok(None);
     }
@@ -129,20 +130,58 @@ fn extract_scalar_value(value: &Bound<'_, PyAny>) -> Option<Value> {
     None
 }
 
+// Upper bound on distinct Python classes remembered while converting one field's value.
+// Union and interface lists mix a handful of object types, so a short linear scan wins.
+const RUNTIME_TYPE_CACHE_CAPACITY: usize = 8;
+
+// Remembers the runtime GraphQL type name of each Python class seen while converting one
+// field's value, so list items resolve each class's metadata at most once, even when
+// union or interface members are interleaved.
+#[derive(Default)]
+struct RuntimeTypeCache {
+    entries: Vec<(Py<PyType>, Option<String>)>,
+}
+
+impl RuntimeTypeCache {
+    fn object_type_name(&mut self, value: &Bound<'_, PyAny>) -> PyResult<Option<String>> {
+        let ty = value.get_type();
+        for (cached_ty, name) in &self.entries {
+            if cached_ty.as_ptr() == ty.as_ptr() {
+                return Ok(name.clone());
+            }
+        }
+        let name = grommet_object_type_name(&ty)?;
+        if self.entries.len() < RUNTIME_TYPE_CACHE_CAPACITY {
+            self.entries.push((ty.unbind(), name.clone()));
+        }
+        Ok(name)
+    }
+}
+
 pub(crate) fn py_to_field_value_for_type(
     py: Python<'_>,
     value: &Bound<'_, PyAny>,
     output_type: &TypeRef,
+) -> PyResult<FieldValue<'static>> {
+    let mut cache = RuntimeTypeCache::default();
+    convert_field_value(py, value, output_type, &mut cache)
+}
+
+fn convert_field_value(
+    py: Python<'_>,
+    value: &Bound<'_, PyAny>,
+    output_type: &TypeRef,
+    cache: &mut RuntimeTypeCache,
 ) -> PyResult<FieldValue<'static>> {
     if value.is_none() {
         return Ok(FieldValue::value(Value::Null));
     }
     match output_type {
-        TypeRef::NonNull(inner) => py_to_field_value_for_type(py, value, inner),
-        TypeRef::List(inner) => convert_sequence_to_field_values(py, value, inner),
+        TypeRef::NonNull(inner) => convert_field_value(py, value, inner, cache),
+        TypeRef::List(inner) => convert_sequence_to_field_values(py, value, inner, cache),
         TypeRef::Named(name) => {
             let type_name: &str = name;
-            convert_named_field_value(value, type_name)
+            convert_named_field_value(value, type_name, cache)
         }
     }
 }
@@ -150,13 +189,14 @@ pub(crate) fn py_to_field_value_for_type(
 fn convert_named_field_value(
     value: &Bound<'_, PyAny>,
     type_name: &str,
+    cache: &mut RuntimeTypeCache,
 ) -> PyResult<FieldValue<'static>> {
     if value.is_none() {
         return Ok(FieldValue::value(Value::Null));
     }
 
     if !is_builtin_scalar(type_name)
-        && let Some(runtime_type_name) = grommet_object_type_name(value)?
+        && let Some(runtime_type_name) = cache.object_type_name(value)?
     {
         let field_value = FieldValue::owned_any(PyObj::new(value.clone().unbind()));
         if runtime_type_name == type_name {
@@ -224,9 +264,10 @@ fn convert_sequence_to_field_values(
     py: Python<'_>,
     value: &Bound<'_, PyAny>,
     inner_type: &TypeRef,
+    cache: &mut RuntimeTypeCache,
 ) -> PyResult<FieldValue<'static>> {
     let items = collect_sequence(value, |item| {
-        py_to_field_value_for_type(py, item, inner_type)
+        convert_field_value(py, item, inner_type, cache)
     })?;
     Ok(FieldValue::list(items))
 }
@@ -259,9 +300,34 @@ pub(crate) fn py_to_value(py: Python<'_>, value: &Bound<'_, PyAny>) -> PyResult<
     Err(unsupported_value_type())
 }
 
+// Hands out one interned Python string per distinct object key while converting a value,
+// so the response names repeated across list items are created once and shared with the
+// interned field names grommet compiled.
+#[derive(Default)]
+struct ObjectKeys<'py> {
+    keys: HashMap<Name, Bound<'py, PyString>>,
+}
+
+impl<'py> ObjectKeys<'py> {
+    fn key(&mut self, py: Python<'py>, name: &Name) -> Bound<'py, PyString> {
+        self.keys
+            .entry(name.clone())
+            .or_insert_with(|| PyString::intern(py, name.as_str()))
+            .clone()
+    }
+}
+
 pub(crate) fn value_to_py_bound<'py>(
     py: Python<'py>,
     value: &Value,
+) -> PyResult<Bound<'py, PyAny>> {
+    convert_value_to_py(py, value, &mut ObjectKeys::default())
+}
+
+fn convert_value_to_py<'py>(
+    py: Python<'py>,
+    value: &Value,
+    keys: &mut ObjectKeys<'py>,
 ) -> PyResult<Bound<'py, PyAny>> {
     match value {
         Value::Null => Ok(py.None().into_bound(py)),
@@ -282,14 +348,14 @@ pub(crate) fn value_to_py_bound<'py>(
         Value::List(items) => {
             let list = PyList::empty(py);
             for item in items {
-                list.append(value_to_py_bound(py, item)?)?;
+                list.append(convert_value_to_py(py, item, keys)?)?;
             }
             Ok(list.into_any())
         }
         Value::Object(map) => {
             let dict = PyDict::new(py);
             for (key, value) in map {
-                dict.set_item(key.as_str(), value_to_py_bound(py, value)?)?;
+                dict.set_item(keys.key(py, key), convert_value_to_py(py, value, keys)?)?;
             }
             Ok(dict.into_any())
         }
@@ -306,7 +372,7 @@ pub(crate) fn response_to_py<'py>(
     py: Python<'py>,
     response: async_graphql::Response,
 ) -> PyResult<Py<PyAny>> {
-    let data = value_to_py_bound(py, &response.data)?.unbind();
+    let data = convert_value_to_py(py, &response.data, &mut ObjectKeys::default())?.unbind();
 
     let extensions_dict = PyDict::new(py);
     for (key, value) in response.extensions {
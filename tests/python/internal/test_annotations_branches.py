@@ -299,3 +299,32 @@ def test_is_input_type_detects_decorated_input_classes():
     """Returns True only for classes decorated as grommet input types."""
     assert _is_input_type(InputType) is True
     assert _is_input_type(OutputType) is False
+
+
+def test_type_spec_cache_shares_scalar_specs_only():
+    """Reuses scalar specs process-wide but rebuilds specs naming grommet types."""
+
+    @grommet.type
+    @dataclass
+    class Named:
+        value: int = 0
+
+    assert _type_spec_from_annotation(
+        list[int] | None, expect_input=False
+    ) is _type_spec_from_annotation(list[int] | None, expect_input=False)
+    assert _type_spec_from_annotation(
+        Named, expect_input=False
+    ) is not _type_spec_from_annotation(Named, expect_input=False)
+    unhashable = Annotated[int, []]
+    assert _type_spec_from_annotation(unhashable, expect_input=False).name == "Int"
+
+
+def test_builtin_scalar_specs_are_prebuilt_singletons():
+    """Returns the module's prebuilt scalar spec even when the cache is bypassed."""
+    unhashable = Annotated[str, []]
+    spec = _type_spec_from_annotation(
+        unhashable, expect_input=True, force_nullable=True
+    )
+    assert spec is annotations_module._SCALAR_SPECS[(str, True)]
+    assert spec.name == "String"
+    assert spec.nullable is True
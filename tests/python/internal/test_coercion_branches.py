@@ -1,6 +1,7 @@
 """Targeted branch coverage tests for grommet.coercion."""
 
 import dataclasses
+import functools
 from dataclasses import dataclass
 from typing import List
 
@@ -11,6 +12,7 @@ from grommet.coercion import (
     _arg_coercer,
     _coerce_input,
     _default_value_for_annotation,
+    _direct_input_type,
     _input_field_default,
 )
 from grommet.metadata import MISSING
@@ -75,6 +77,22 @@ def test_arg_coercer_handles_list_optional_and_non_input_annotations():
     assert _arg_coercer(str | None) is None
 
 
+def test_arg_coercer_binds_input_types_without_a_python_closure():
+    """Uses a C-level partial for bare input coercion instead of a wrapping lambda."""
+    coercer = _arg_coercer(ChildInput)
+    assert isinstance(coercer, functools.partial)
+    assert coercer.func is _coerce_input
+    assert coercer({"value": 3}) == ChildInput(value=3)
+
+
+def test_direct_input_type_only_matches_bare_input_annotations():
+    """Finds input classes the adapter can build inline from argument mappings."""
+    assert _direct_input_type(ChildInput) is ChildInput
+    assert _direct_input_type(ChildInput | None) is None
+    assert _direct_input_type(list[ChildInput]) is None
+    assert _direct_input_type(int) is None
+
+
 def test_coerce_input_accepts_instances_dicts_and_rejects_other_values():
     """Converts mappings to dataclass inputs and rejects unsupported values."""
     instance = ChildInput(value=9)
@@ -1,26 +1,42 @@
 """Targeted branch coverage tests for decorator and compiler internals."""
 
+import asyncio
 import dataclasses
+import functools
+import gc
 import inspect
+import sys
+import weakref
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Annotated
 
 import pytest
 
 import grommet
-from grommet._compiled import COMPILED_RESOLVER_ATTR
+from grommet._compiled import COMPILED_RESOLVER_ATTR, COMPILED_TYPE_ATTR
 from grommet._resolver_compiler import (
+    _SYNCIFIABLE_CODE,
     _build_arg_info,
+    _can_syncify,
     _collect_refs,
+    _is_async_gen,
+    _is_coroutine,
+    _resolver_hints,
+    _resolver_params,
+    _signature_params,
+    _syncified,
     compile_resolver_field,
 )
 from grommet._type_compiler import (
-    _data_field_resolver,
     _get_annotated_field_meta,
     _implemented_interfaces,
+    _partition_compiled_resolvers,
     _resolve_data_field_default,
 )
+from grommet.errors import GrommetTypeError
+from grommet.metadata import ResolverKind
 
 
 def test_type_decorator_requires_dataclasses():
@@ -63,7 +79,7 @@ def test_compile_resolver_field_rejects_missing_parameter_annotations():
 
     with pytest.raises(TypeError, match="missing annotation"):
         compile_resolver_field(
-            resolver, field_name="value", description=None, kind="field"
+            resolver, field_name="value", description=None, kind=ResolverKind.FIELD
         )
 
 
@@ -75,7 +91,7 @@ def test_compile_resolver_field_rejects_missing_return_annotation():
 
     with pytest.raises(TypeError, match="missing annotation for 'return'"):
         compile_resolver_field(
-            resolver, field_name="value", description=None, kind="field"
+            resolver, field_name="value", description=None, kind=ResolverKind.FIELD
         )
 
 
@@ -87,7 +103,7 @@ def test_compile_resolver_field_rejects_bare_context_annotations():
 
     with pytest.raises(TypeError, match=r"Annotated\[T, grommet\.Context\]"):
         compile_resolver_field(
-            resolver, field_name="value", description=None, kind="field"
+            resolver, field_name="value", description=None, kind=ResolverKind.FIELD
         )
 
 
@@ -99,19 +115,22 @@ def test_compile_subscription_field_requires_async_generator_resolvers():
 
     with pytest.raises(TypeError, match="must be async"):
         compile_resolver_field(
-            resolver, field_name="ticks", description=None, kind="subscription"
+            resolver,
+            field_name="ticks",
+            description=None,
+            kind=ResolverKind.SUBSCRIPTION,
         )
 
 
-def test_compiled_resolver_adapter_skips_missing_kwargs_and_uses_defaults():
-    """Uses resolver defaults when kwargs omit optional GraphQL arguments."""
+def test_compiled_resolver_adapter_skips_missing_args_and_uses_defaults():
+    """Uses resolver defaults when optional GraphQL arguments are MISSING."""
 
     @grommet.field
     def resolver(self, value: int = 7) -> int:
         return value
 
     compiled = getattr(resolver, COMPILED_RESOLVER_ATTR)
-    assert compiled.func(None, None, {}) == 7
+    assert compiled.func(None, None, (dataclasses.MISSING,)) == 7
 
 
 def test_build_arg_info_rejects_missing_annotations_for_graphql_args():
@@ -202,25 +221,23 @@ def test_subscription_decorator_factory_returns_wrapper():
         yield 1
 
     compiled = getattr(ticks, COMPILED_RESOLVER_ATTR)
-    assert compiled.kind == "subscription"
+    assert compiled.kind is ResolverKind.SUBSCRIPTION
     assert compiled.description == "Ticker stream"
 
 
-def test_data_field_resolver_returns_default_when_parent_is_none():
-    """Returns a configured default value when resolving root-level missing parent objects."""
-    resolver = _data_field_resolver("missing", has_default=True, default="fallback")
-    assert resolver(None, None, {}) == "fallback"
-
-
-def test_data_field_resolver_reads_parent_attribute_when_present():
-    """Uses attrgetter path when a parent object is available."""
+def test_data_fields_resolve_through_attrgetter_and_carry_defaults():
+    """Leaves root-level defaults to the compiled field and reads parents via attrgetter."""
 
+    @grommet.type
     @dataclass
     class Parent:
-        value: str = "ok"
+        value: str = "fallback"
 
-    resolver = _data_field_resolver("value", has_default=True, default="fallback")
-    assert resolver(Parent(), None, {}) == "ok"
+    (field,) = getattr(Parent, COMPILED_TYPE_ATTR).object_fields
+    assert isinstance(field.resolver_func, attrgetter)
+    assert field.resolver_func(Parent(value="ok")) == "ok"
+    assert field.has_default is True
+    assert field.default == "fallback"
 
 
 def test_resolve_data_field_default_uses_default_factory_values():
@@ -255,3 +272,377 @@ def test_implemented_interfaces_ignores_non_interface_grommet_bases():
         pass
 
     assert _implemented_interfaces(ChildObject) == ((), ())
+
+
+def test_compiled_blueprints_do_not_carry_instance_dicts():
+    """Keeps compiled resolver and type blueprints slotted for per-request reads."""
+
+    @grommet.type
+    @dataclass
+    class Slotted:
+        value: int = 1
+
+        @grommet.field
+        def doubled(self) -> int:
+            return self.value * 2
+
+    compiled_type = getattr(Slotted, COMPILED_TYPE_ATTR)
+    compiled_resolver = getattr(Slotted.doubled, COMPILED_RESOLVER_ATTR)
+    for blueprint in (compiled_type, compiled_resolver, *compiled_type.object_fields):
+        assert not hasattr(blueprint, "__dict__")
+
+
+def test_resolver_adapters_share_compiled_code_per_call_shape():
+    """Reuses one compiled adapter body for resolvers with identical call shapes."""
+
+    @grommet.input
+    @dataclass
+    class Filter:
+        term: str
+
+    @grommet.field
+    def first(
+        self,
+        ctx: Annotated[dict[str, str], grommet.Context],
+        query: Filter,
+        limit: int = 3,
+    ) -> str:
+        return f"{ctx['user']}:{query.term}:{limit}"
+
+    @grommet.field
+    def second(
+        self,
+        ctx: Annotated[dict[str, str], grommet.Context],
+        query: Filter,
+        limit: int = 3,
+    ) -> str:
+        return f"{ctx['user']}/{query.term}/{limit}"
+
+    first_compiled = getattr(first, COMPILED_RESOLVER_ATTR)
+    second_compiled = getattr(second, COMPILED_RESOLVER_ATTR)
+    assert first_compiled.func.__code__ is second_compiled.func.__code__
+    assert first_compiled.func.__qualname__ == first.__qualname__
+
+    context = {"user": "ada"}
+    assert (
+        first_compiled.func(None, context, ({"term": "x"}, dataclasses.MISSING))
+        == "ada:x:3"
+    )
+    assert second_compiled.func(None, context, ({"term": "y"}, 1)) == "ada/y/1"
+
+
+def test_self_only_resolvers_skip_the_adapter():
+    """Passes resolvers without context or arguments through to Rust unwrapped."""
+
+    @grommet.field
+    def plain(self) -> int:
+        return 1
+
+    @grommet.field
+    def with_arg(self, value: int) -> int:
+        return value
+
+    plain_compiled = getattr(plain, COMPILED_RESOLVER_ATTR)
+    assert plain_compiled.self_only is True
+    assert plain_compiled.func is plain
+
+    arg_compiled = getattr(with_arg, COMPILED_RESOLVER_ATTR)
+    assert arg_compiled.self_only is False
+    assert arg_compiled.func(None, None, (2,)) == 2
+
+
+def test_resolver_hints_are_resolved_once_per_function():
+    """Reuses the resolved annotations when the same resolver is compiled again."""
+
+    def resolver(self, value: int) -> int:
+        return value
+
+    first = compile_resolver_field(
+        resolver, field_name="value", description=None, kind=ResolverKind.FIELD
+    )
+    second = compile_resolver_field(
+        resolver, field_name="value", description=None, kind=ResolverKind.FIELD
+    )
+
+    assert _resolver_hints(resolver) is _resolver_hints(resolver)
+    assert first.args == second.args
+
+
+def test_is_async_gen_reads_code_flags_and_falls_back_for_wrappers():
+    """Detects async generators from code flags and falls back for code-less wrappers."""
+
+    async def ticker(start: int):
+        yield start
+
+    async def coroutine() -> int:
+        return 1
+
+    assert _is_async_gen(ticker) is True
+    assert _is_async_gen(coroutine) is False
+    assert _is_async_gen(functools.partial(ticker, 1)) is True
+    assert _is_async_gen(len) is False
+
+
+def test_is_coroutine_reads_code_flags_and_falls_back_for_wrappers():
+    """Detects coroutine functions from code flags and falls back for code-less wrappers."""
+
+    async def coroutine(value: int) -> int:
+        return value
+
+    def plain() -> int:
+        return 1
+
+    assert _is_coroutine(coroutine) is True
+    assert _is_coroutine(plain) is False
+    assert _is_coroutine(functools.partial(coroutine, 1)) is True
+    assert _is_coroutine(len) is False
+
+
+def test_marked_coroutine_functions_compile_as_async_resolvers():
+    """Keeps sync functions marked with markcoroutinefunction async and unsyncified."""
+
+    async def fetch(value: int) -> int:
+        return value
+
+    def greeting(self) -> int:
+        return fetch(1)
+
+    inspect.markcoroutinefunction(greeting)
+    compiled = getattr(grommet.field(greeting), COMPILED_RESOLVER_ATTR)
+
+    assert _is_coroutine(greeting) is True
+    assert _can_syncify(greeting) is False
+    assert compiled.is_async is True
+    assert compiled.func is greeting
+    assert asyncio.run(compiled.func(None)) == 1
+
+
+def test_context_only_adapter_ignores_args():
+    """Lets Rust pass None instead of an args tuple to context-only resolvers."""
+
+    @grommet.field
+    def whoami(self, ctx: Annotated[dict[str, str], grommet.Context]) -> str:
+        return ctx["user"]
+
+    compiled = getattr(whoami, COMPILED_RESOLVER_ATTR)
+    assert compiled.self_only is False
+    assert compiled.args == ()
+    assert compiled.func(None, {"user": "ada"}, None) == "ada"
+
+
+def test_redecorating_a_type_recompiles_its_blueprint():
+    """Picks up resolvers added to a class before it is decorated again."""
+
+    @grommet.type
+    @dataclass
+    class Query:
+        greeting: str = "hi"
+
+    compiled = getattr(Query, COMPILED_TYPE_ATTR)
+
+    @grommet.field
+    def farewell(self) -> str:
+        return "bye"
+
+    Query.farewell = farewell
+    recompiled = getattr(grommet.type(Query), COMPILED_TYPE_ATTR)
+    assert recompiled is not compiled
+    assert [field.name for field in recompiled.object_fields] == [
+        "greeting",
+        "farewell",
+    ]
+
+
+def test_resolver_params_cache_signatures_and_handle_unhashable_callables():
+    """Caches parsed signatures per resolver and skips the cache when unhashable."""
+
+    def resolver(self, value: int, *args: int, **kwargs: int) -> int:
+        return value
+
+    class Unhashable:
+        __hash__ = None
+
+        def __call__(self, parent: object, value: int) -> int:
+            return value
+
+    assert _signature_params(resolver) is _signature_params(resolver)
+    assert [p.name for p in _resolver_params(resolver)] == ["self", "value"]
+    assert [p.name for p in _resolver_params(Unhashable())] == ["parent", "value"]
+
+
+def test_signature_params_read_plain_functions_from_code_objects():
+    """Matches inspect.signature for plain functions and defers to it for wrappers."""
+
+    def resolver(
+        self, first: int, /, second: str = "a", *args: int, third: bool, fourth=1
+    ) -> int:
+        return first
+
+    expected = tuple(
+        p
+        for p in inspect.signature(resolver).parameters.values()
+        if p.kind
+        not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+    )
+    assert _signature_params(resolver) == expected
+
+    @functools.wraps(resolver)
+    def wrapper(*args, **kwargs) -> int:
+        return resolver(*args, **kwargs)
+
+    assert _signature_params(wrapper) == expected
+
+
+def test_syncify_checks_are_memoized_per_code_object_without_retaining_it():
+    """Reuses the cached await-free check per code object and drops it with the code."""
+    namespace: dict[str, object] = {}
+    exec("async def resolver(self) -> int:\n    return 1\n", namespace)
+    resolver = namespace.pop("resolver")
+
+    compiled = compile_resolver_field(
+        resolver, field_name="value", description=None, kind=ResolverKind.FIELD
+    )
+    assert _SYNCIFIABLE_CODE[resolver.__code__] is True
+    assert compiled.is_async is False
+    assert compiled.func(None) == 1
+
+    # A cached verdict is trusted on recompilation instead of re-walking bytecode.
+    _SYNCIFIABLE_CODE[resolver.__code__] = False
+    recompiled = compile_resolver_field(
+        resolver, field_name="value", description=None, kind=ResolverKind.FIELD
+    )
+    assert recompiled.is_async is True
+
+    code = weakref.ref(resolver.__code__)
+    entries = len(_SYNCIFIABLE_CODE)
+    del resolver, compiled, recompiled
+    gc.collect()
+    assert code() is None
+    assert len(_SYNCIFIABLE_CODE) == entries - 1
+
+
+def test_syncified_resolver_returns_and_raises_without_an_event_loop():
+    """Completes await-free coroutines in one send and propagates their exceptions."""
+
+    async def double(self, value: int) -> int:
+        if value < 0:
+            raise ValueError("negative")
+        return value * 2
+
+    sync = _syncified(double, False)
+    assert sync(None, value=2) == 4
+    assert sync.__name__ == "double"
+    with pytest.raises(ValueError, match="negative"):
+        sync(None, value=-1)
+
+    async def suspends(self, delay: float = 0) -> None:
+        await asyncio.sleep(delay)
+
+    for self_only, kwargs in ((True, {}), (False, {"delay": 0})):
+        with pytest.raises(RuntimeError, match="'suspends' awaited unexpectedly"):
+            _syncified(suspends, self_only)(None, **kwargs)
+
+
+def test_self_only_syncified_resolver_takes_just_the_parent():
+    """Gives argument-free async resolvers a one-parameter sync shim for Rust to call."""
+
+    @grommet.field
+    async def label(self) -> str:
+        return "ok"
+
+    compiled = getattr(label, COMPILED_RESOLVER_ATTR)
+    assert compiled.self_only is True
+    assert compiled.is_async is False
+    assert list(inspect.signature(compiled.func, follow_wrapped=False).parameters) == [
+        "parent"
+    ]
+    assert compiled.func(None) == "ok"
+
+
+def test_partition_compiled_resolvers_splits_by_kind_in_mro_order():
+    """Separates field and subscription resolvers while letting subclasses shadow bases."""
+
+    @dataclass
+    class Base:
+        @grommet.field
+        async def shared(self) -> int:
+            return 1
+
+        @grommet.subscription
+        async def ticks(self) -> AsyncIterator[int]:
+            yield 1
+
+    @dataclass
+    class Child(Base):
+        @grommet.field
+        async def shared(self) -> int:
+            return 2
+
+    field_resolvers, subscription_resolvers = _partition_compiled_resolvers(Child)
+    assert field_resolvers == [getattr(Child.shared, COMPILED_RESOLVER_ATTR)]
+    assert [resolver.name for resolver in subscription_resolvers] == ["ticks"]
+
+
+def test_compiled_field_and_type_names_are_interned():
+    """Interns names passed at decoration so runtime name comparisons hit identity."""
+    field_name = "".join(["gree", "ting"])
+    type_name = "".join(["Gree", "ter"])
+
+    @grommet.type(name=type_name)
+    @dataclass
+    class Greeter:
+        @grommet.field(name=field_name)
+        def hello(self) -> str:
+            return "hi"
+
+    compiled = getattr(Greeter, COMPILED_TYPE_ATTR)
+    assert compiled.meta.name is sys.intern("Greeter")
+    assert compiled.object_fields[0].name is sys.intern("greeting")
+
+
+def test_adapter_coerces_list_and_optional_input_arguments():
+    """Converts nested input dicts through per-argument coercers in the adapter."""
+
+    @grommet.input
+    @dataclass
+    class Point:
+        x: int
+
+    @grommet.field
+    def total(self, points: list[Point], origin: Point | None = None) -> int:
+        offset = origin.x if origin is not None else 0
+        return offset + sum(point.x for point in points)
+
+    compiled = getattr(total, COMPILED_RESOLVER_ATTR)
+    points = [{"x": 1}, {"x": 2}]
+    assert compiled.func(None, None, (points, dataclasses.MISSING)) == 3
+    assert compiled.func(None, None, (points, {"x": 10})) == 13
+
+
+def test_adapter_reports_explicit_null_for_defaulted_input_arguments():
+    """Routes defaulted input args through coercion so an explicit null is reported."""
+
+    @grommet.input
+    @dataclass
+    class Point:
+        x: int
+
+    start = Point(x=0)
+
+    @grommet.field
+    def shifted(self, origin: Point = start) -> int:
+        return origin.x + 1
+
+    compiled = getattr(shifted, COMPILED_RESOLVER_ATTR)
+    assert compiled.func(None, None, ({"x": 4},)) == 5
+    with pytest.raises(GrommetTypeError, match="Expected mapping for input type"):
+        compiled.func(None, None, (None,))
+
+
+def test_can_syncify_leaves_code_less_callables_async():
+    """Leaves wrapped coroutine functions async since noaio cannot inspect them."""
+
+    async def resolver(self, value: int) -> int:
+        return value
+
+    assert _can_syncify(functools.partial(resolver, value=1)) is False
@@ -0,0 +1,118 @@
+"""Targeted branch coverage tests for grommet.dataloader."""
+
+import asyncio
+
+import pytest
+
+from grommet import DataLoader
+from grommet.errors import GrommetTypeError
+
+
+async def test_loads_in_one_iteration_share_a_single_batch():
+    """Coalesces sibling loads into one batch call and dedupes repeated keys."""
+    calls: list[list[int]] = []
+
+    async def fetch(keys: list[int]) -> list[str]:
+        calls.append(keys)
+        return [f"user-{key}" for key in keys]
+
+    loader = DataLoader(fetch)
+    results = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1))
+
+    assert results == ["user-1", "user-2", "user-1"]
+    assert calls == [[1, 2]]
+    assert await loader.load(2) == "user-2"
+    assert calls == [[1, 2]]
+
+
+async def test_clear_refetches_a_cached_key():
+    """Forgets a cached key so the next load dispatches a new batch."""
+    calls: list[list[int]] = []
+
+    async def fetch(keys: list[int]) -> list[int]:
+        calls.append(keys)
+        return [key * 10 for key in keys]
+
+    loader = DataLoader(fetch)
+    assert await loader.load(1) == 10
+    loader.clear(1)
+    loader.clear(2)
+    assert await loader.load(1) == 10
+    assert calls == [[1], [1]]
+
+
+async def test_batch_failures_reject_every_key_and_allow_retries():
+    """Propagates batch errors to each waiting load and forgets the failed keys."""
+    attempts = 0
+
+    async def flaky(keys: list[int]) -> list[int]:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise RuntimeError("backend down")
+        return keys
+
+    loader = DataLoader(flaky)
+    first, second = await asyncio.gather(
+        loader.load(1), loader.load(2), return_exceptions=True
+    )
+    assert isinstance(first, RuntimeError)
+    assert second is first
+    assert await loader.load(1) == 1
+
+
+async def test_batch_result_count_must_match_keys():
+    """Rejects batches whose result list does not line up with the requested keys."""
+
+    async def short(keys: list[int]) -> list[int]:
+        return keys[:1]
+
+    loader = DataLoader(short)
+    with pytest.raises(GrommetTypeError, match="returned 1 values for 2 keys"):
+        await asyncio.gather(loader.load(1), loader.load(2))
+
+
+async def test_cancelling_one_waiter_leaves_the_shared_result_intact():
+    """Cancels only the caller's wait while other and later loads still resolve."""
+    calls: list[list[int]] = []
+
+    async def fetch(keys: list[int]) -> list[int]:
+        calls.append(keys)
+        await asyncio.sleep(0)
+        return keys
+
+    loader = DataLoader(fetch)
+    cancelled = asyncio.ensure_future(loader.load(1))
+    kept = loader.load(1)
+    cancelled.cancel()
+
+    assert await kept == 1
+    assert cancelled.cancelled()
+    assert await loader.load(1) == 1
+    assert calls == [[1]]
+
+
+async def test_cancelled_batches_cancel_waiters_and_forget_keys():
+    """Settles every waiter when the batch task is cancelled and allows a retry."""
+    release = asyncio.Event()
+
+    async def fetch(keys: list[int]) -> list[int]:
+        await release.wait()
+        return keys
+
+    loader = DataLoader(fetch)
+    waiters = asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+    await asyncio.sleep(0)
+    loader.clear(2)
+    reloaded = loader.load(2)
+    (task,) = loader._tasks
+    await asyncio.sleep(0)
+    task.cancel()
+    assert len(loader._tasks) == 2
+
+    first, second = await waiters
+    assert isinstance(first, asyncio.CancelledError)
+    assert isinstance(second, asyncio.CancelledError)
+    release.set()
+    assert await loader.load(1) == 1
+    assert await reloaded == 2
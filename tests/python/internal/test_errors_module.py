@@ -7,6 +7,7 @@ from grommet.errors import (
     GrommetTypeError,
     async_iterable_requires_parameter,
     dataclass_required,
+    dataloader_result_count_mismatch,
     decorator_requires_callable,
     input_field_resolver_not_allowed,
     input_mapping_expected,
@@ -78,6 +79,10 @@ from grommet.errors import (
             lambda: union_definition_conflict("Named"),
             "Union 'Named' has conflicting definitions across the schema graph.",
         ),
+        (
+            lambda: dataloader_result_count_mismatch(3, 2),
+            "DataLoader batch function returned 2 values for 3 keys.",
+        ),
     ],
 )
 def test_error_factories_emit_expected_type_and_message(factory, expected_message: str):
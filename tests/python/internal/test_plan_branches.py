@@ -44,7 +44,7 @@ def _compiled_object_with_union(
         description=None,
         has_default=True,
         default=1,
-        resolver_func=lambda self, _context, _kwargs: self.value,
+        resolver_func=lambda self: self.value,
         refs=frozenset(),
     )
     return CompiledType(
@@ -199,7 +199,7 @@ def test_validate_root_defaults_rejects_missing_defaults():
                 description=None,
                 has_default=False,
                 default=None,
-                resolver_func=lambda self, _context, _kwargs: self.greeting,
+                resolver_func=lambda self: self.greeting,
                 refs=frozenset(),
             ),
         ),
@@ -220,6 +220,45 @@ def test_build_schema_graph_rejects_roots_missing_compiled_type_metadata():
         build_schema_graph(query=Plain)
 
 
+def test_build_schema_graph_freezes_collected_types():
+    """Hands Rust an immutable tuple of compiled types."""
+
+    @grommet.type
+    @dataclass
+    class Query:
+        greeting: str = "hi"
+
+    bundle = build_schema_graph(query=Query)
+
+    assert isinstance(bundle.types, tuple)
+    assert bundle.types == (getattr(Query, COMPILED_TYPE_ATTR),)
+
+
+def test_build_schema_graph_picks_up_implementers_defined_later():
+    """Includes interface implementers declared after an earlier schema build."""
+
+    @grommet.interface
+    @dataclass
+    class Node:
+        id: str
+
+    @grommet.type
+    @dataclass
+    class Query:
+        node: Node | None = None
+
+    first = build_schema_graph(query=Query)
+
+    @grommet.type
+    @dataclass
+    class User(Node):
+        name: str
+
+    rebuilt = build_schema_graph(query=Query)
+    assert rebuilt is not first
+    assert getattr(User, COMPILED_TYPE_ATTR) in rebuilt.types
+
+
 def test_class_sort_key_uses_module_and_qualname():
     """Builds deterministic sort keys from module and qualname."""
     key = _class_sort_key(TypeMeta)
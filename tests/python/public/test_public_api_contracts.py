@@ -23,6 +23,7 @@ def test_public_exports_match_the_supported_surface():
     """Ensures __all__ exposes the documented public entry points."""
     expected = {
         "Context",
+        "DataLoader",
         "Field",
         "Hidden",
         "Schema",
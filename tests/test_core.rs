@@ -68,15 +68,137 @@ mod resolver {
     #[cfg(test)]
     mod tests {
         use super::*;
+        use std::sync::{Arc, Mutex};
         use std::task::{Context, Poll, Waker};
 
-        use pyo3::types::PyDict;
+        use pyo3::exceptions::PyTypeError;
+        use pyo3::types::{PyCFunction, PyDict};
 
         fn noop_waker() -> Waker {
             Waker::noop().clone()
         }
 
-        /// Ensures custom awaitable bridge reports missing event loop errors.
+        // Polls bridged awaitables from inside a running asyncio loop. `poll(awaitable)` starts
+        // a new bridge and `poll(None)` re-polls it; each call reports `(ready, value)`, with
+        // errors returned as exception objects.
+        fn drive_in_loop(
+            py: Python<'_>,
+            awaitable_factory: &str,
+            custom_task_factory: bool,
+        ) -> Vec<(bool, Py<PyAny>)> {
+            let locals = PyDict::new(py);
+            py.run(
+                pyo3::ffi::c_str!(
+                    r#"
+import asyncio
+
+async def seven():
+    return 7
+
+def not_awaitable():
+    return 42
+
+def custom_task_factory(loop, coro, **kwargs):
+    return asyncio.Task(coro, loop=loop, **kwargs)
+
+def drive(poll, awaitable_factory, task_factory):
+    async def main():
+        if task_factory is not None:
+            asyncio.get_running_loop().set_task_factory(task_factory)
+        outcomes = [poll(awaitable_factory())]
+        for _ in range(10):
+            if outcomes[-1][0]:
+                break
+            await asyncio.sleep(0)
+            outcomes.append(poll(None))
+        return outcomes
+    return asyncio.run(main())
+"#
+                ),
+                None,
+                Some(&locals),
+            )
+            .unwrap();
+
+            let future: Arc<Mutex<Option<BoxFut>>> = Arc::new(Mutex::new(None));
+            let poll = PyCFunction::new_closure(
+                py,
+                None,
+                None,
+                move |args, _kwargs| -> PyResult<(bool, Option<Py<PyAny>>)> {
+                    let py = args.py();
+                    let awaitable = args.get_item(0)?;
+                    let mut slot = future.lock().expect("poller state poisoned");
+                    if !awaitable.is_none() {
+                        *slot = Some(awaitable_into_future(awaitable));
+                    }
+                    let waker = noop_waker();
+                    let mut cx = Context::from_waker(&waker);
+                    let bridged = slot.as_mut().expect("no awaitable to poll");
+                    Ok(match bridged.as_mut().poll(&mut cx) {
+                        Poll::Ready(Ok(value)) => (true, Some(value)),
+                        Poll::Ready(Err(err)) => (true, Some(err.into_value(py).into_any())),
+                        Poll::Pending => (false, None),
+                    })
+                },
+            )
+            .unwrap();
+
+            let factory = locals.get_item(awaitable_factory).unwrap().unwrap();
+            let task_factory = if custom_task_factory {
+                locals.get_item("custom_task_factory").unwrap().unwrap()
+            } else {
+                py.None().into_bound(py)
+            };
+            locals
+                .get_item("drive")
+                .unwrap()
+                .unwrap()
+                .call1((poll, factory, task_factory))
+                .unwrap()
+                .extract()
+                .unwrap()
+        }
+
+        /// Ensures coroutines that never suspend complete on the first poll.
+        #[test]
+        fn awaitable_bridge_completes_eager_tasks_inline() {
+            crate::with_py(|py| {
+                let outcomes = drive_in_loop(py, "seven", false);
+                assert_eq!(outcomes.len(), 1);
+                let (ready, value) = &outcomes[0];
+                assert!(*ready);
+                assert_eq!(value.bind(py).extract::<i64>().unwrap(), 7);
+            });
+        }
+
+        /// Ensures loops with their own task factory schedule through `create_task`.
+        #[test]
+        fn awaitable_bridge_defers_to_custom_task_factories() {
+            crate::with_py(|py| {
+                let outcomes = drive_in_loop(py, "seven", true);
+                assert!(outcomes.len() > 1);
+                assert!(!outcomes[0].0);
+                let (ready, value) = outcomes.last().unwrap();
+                assert!(*ready);
+                assert_eq!(value.bind(py).extract::<i64>().unwrap(), 7);
+            });
+        }
+
+        /// Ensures start errors inside a running loop are reported on the following poll.
+        #[test]
+        fn awaitable_bridge_reports_start_errors_on_the_next_poll() {
+            crate::with_py(|py| {
+                let outcomes = drive_in_loop(py, "not_awaitable", false);
+                assert_eq!(outcomes.len(), 2);
+                assert!(!outcomes[0].0);
+                let (ready, error) = &outcomes[1];
+                assert!(*ready);
+                assert!(error.bind(py).is_instance_of::<PyTypeError>());
+            });
+        }
+
+        /// Ensures missing event loop errors are stored on start and reported on the next poll.
         #[test]
         fn awaitable_bridge_requires_running_loop() {
             let mut future = crate::with_py(|py| {
@@ -156,3 +278,144 @@ class IterOnly:
         }
     }
 }
+
+mod schema_types {
+    include!(concat!(env!("CARGO_MANIFEST_DIR"), "/src/schema_types.rs"));
+}
+
+mod api {
+    include!(concat!(env!("CARGO_MANIFEST_DIR"), "/src/api.rs"));
+
+    #[cfg(test)]
+    mod tests {
+        use super::*;
+
+        use pyo3::types::PyDict;
+
+        fn schema_wrapper(py: Python<'_>) -> SchemaWrapper {
+            let locals = PyDict::new(py);
+            py.run(
+                pyo3::ffi::c_str!(
+                    r#"
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+import grommet
+from grommet.plan import build_schema_graph
+
+@grommet.type
+@dataclass
+class Query:
+    greeting: str = "Hello!"
+
+@grommet.type
+@dataclass
+class Subscription:
+    @grommet.subscription
+    async def counter(self, limit: int) -> AsyncIterator[int]:
+        for i in range(limit):
+            yield i
+
+bundle = build_schema_graph(query=Query, subscription=Subscription)
+"#
+                ),
+                None,
+                Some(&locals),
+            )
+            .unwrap();
+            let bundle = locals.get_item("bundle").unwrap().unwrap();
+            SchemaWrapper::new(py, &bundle).unwrap()
+        }
+
+        fn cached_documents(schema: &SchemaWrapper) -> usize {
+            schema.documents.lock().unwrap().len()
+        }
+
+        /// Ensures repeated query texts are served from the parsed document cache.
+        #[test]
+        fn parsed_documents_are_cached_per_query_text() {
+            crate::with_py(|py| {
+                let schema = schema_wrapper(py);
+                let query = "{ greeting }";
+
+                let first = schema.parsed_document(query).unwrap();
+                assert_eq!(cached_documents(&schema), 1);
+                let second = schema.parsed_document(query).unwrap();
+                assert_eq!(cached_documents(&schema), 1);
+                assert_eq!(first.operations.iter().count(), 1);
+                assert_eq!(second.operations.iter().count(), 1);
+                assert!(!schema.is_subscription(&second));
+            });
+        }
+
+        /// Ensures subscriptions are still detected from a cached document.
+        #[test]
+        fn cached_documents_detect_subscriptions() {
+            crate::with_py(|py| {
+                let schema = schema_wrapper(py);
+                let query = "subscription { counter(limit: 2) }";
+
+                schema.parsed_document(query).unwrap();
+                let cached = schema.parsed_document(query).unwrap();
+                assert_eq!(cached_documents(&schema), 1);
+                assert!(schema.is_subscription(&cached));
+            });
+        }
+
+        /// Ensures parse errors match async-graphql's own report and are never cached.
+        #[test]
+        fn parse_errors_match_async_graphql_and_are_not_cached() {
+            crate::with_py(|py| {
+                let schema = schema_wrapper(py);
+                let query = "{ greeting";
+
+                let err = match schema.parsed_document(query) {
+                    Ok(_) => panic!("expected parse error"),
+                    Err(err) => err,
+                };
+                let expected = match Request::new(query).parsed_query() {
+                    Ok(_) => panic!("expected async-graphql parse error"),
+                    Err(err) => err,
+                };
+                assert_eq!(err, expected);
+                assert_eq!(cached_documents(&schema), 0);
+            });
+        }
+
+        /// Ensures oversized query texts are parsed without being kept as cache keys.
+        #[test]
+        fn oversized_queries_bypass_the_document_cache() {
+            crate::with_py(|py| {
+                let schema = schema_wrapper(py);
+                let query = format!("{{ greeting }}{}", " ".repeat(DOCUMENT_CACHE_MAX_QUERY_LEN));
+
+                schema.parsed_document(&query).unwrap();
+                assert_eq!(cached_documents(&schema), 0);
+            });
+        }
+
+        /// Ensures a full cache evicts a single entry rather than being cleared.
+        #[test]
+        fn full_document_cache_evicts_one_entry() {
+            crate::with_py(|py| {
+                let schema = schema_wrapper(py);
+                for alias in 0..DOCUMENT_CACHE_CAPACITY {
+                    schema
+                        .parsed_document(&format!("{{ a{alias}: greeting }}"))
+                        .unwrap();
+                }
+                assert_eq!(cached_documents(&schema), DOCUMENT_CACHE_CAPACITY);
+
+                schema.parsed_document("{ greeting }").unwrap();
+                assert_eq!(cached_documents(&schema), DOCUMENT_CACHE_CAPACITY);
+                assert!(
+                    schema
+                        .documents
+                        .lock()
+                        .unwrap()
+                        .contains_key("{ greeting }")
+                );
+            });
+        }
+    }
+}